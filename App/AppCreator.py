@@ -4,9 +4,11 @@ from App.Pages.Prediction import get_program_data
 from App.PageTamplate import ModuleTab
 from App.themes import LIGHT_THEME, DARK_THEME
 from App.App_state import AppState
+from App.Models.TrainingPool import get_training_pool
 from App.translations import TRANSLATIONS
 from App.Pages.HomePage import get_program_data as get_home_data
 from Launcher.ConfigManager import ConfigManager
+from Launcher.StartupProfiler import StartupProfiler
 from AppConfigurator import AppSettings
 
 from PySide6.QtGui import QIcon
@@ -241,7 +243,8 @@ class MainWindow(QMainWindow, AppState):
     def __init__(self):
         super().__init__()
 
-        config = ConfigManager.load_config()
+        with StartupProfiler.phase("ConfigManager.load_config"):
+            config = ConfigManager.load_config()
         self.current_language = config["language"]
         self.current_theme = config["theme"]
 
@@ -257,7 +260,8 @@ class MainWindow(QMainWindow, AppState):
         self.resize(1280, 720)
         self.setMinimumSize(1280, 720)
 
-        self._init_ui()
+        with StartupProfiler.phase("MainWindow._init_ui"):
+            self._init_ui()
         self.apply_theme(self.current_theme)
 
     def _init_ui(self):
@@ -292,6 +296,7 @@ class MainWindow(QMainWindow, AppState):
 
         self.module_tabs = {}
         self.current_module_type = None
+        self._pool_warmed = False
 
         main_layout.addWidget(self.menu)
         main_layout.addWidget(self.stacked_widget)
@@ -306,6 +311,11 @@ class MainWindow(QMainWindow, AppState):
 
     def change_tab(self, index):
         self.stacked_widget.setCurrentIndex(index)
+        if self.stacked_widget.currentWidget() is self.prediction_tab and not self._pool_warmed:
+            # Proces puli z TensorFlow dopiero przy pierwszym wejściu na predykcję - sam ekran
+            # główny nie płaci za pamięć i import TF
+            self._pool_warmed = True
+            get_training_pool().warm_up()
 
     def open_settings(self):
         SettingsWindow(self).exec()
@@ -0,0 +1,226 @@
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from App.Data.Bars import OHLCV_COLUMNS, period_to_timedelta, index_to_utc_ns, slice_period
+from App.Data.Providers import get_provider
+from App.Data.Resample import INTERVAL_SECONDS, RESAMPLE_SOURCES, SOURCE_FETCH_PERIODS, resample_ohlcv
+from App.Data.SingleFlight import INFLIGHT
+from Launcher.ConfigManager import ConfigManager
+
+
+class BarStore:
+    """
+    Lokalny magazyn świec OHLCV, kluczowany (provider, symbol, interval).
+
+    Każdy klucz to jeden plik .npz z kolumnami (index, Open, ..., Volume).
+    Po pierwszym pełnym pobraniu dociągane są tylko świece nowsze niż ostatnia
+    zapisana; ostatnia świeca jest zawsze nadpisywana, bo mogła być niepełna.
+    Grubsze interwały (15m, 60m, 1wk, 1mo) są składane lokalnie z drobniejszych,
+    jeśli te pokrywają żądane okno.
+    """
+
+    STORE_PATH = ConfigManager.APP_FOLDER_PATH / "Cache" / "bars"
+    # Świece źródłowe młodsze niż interwał (max 15 min) uznajemy za aktualne bez pytania sieci
+    MAX_FRESH_SECONDS = 900
+
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    @staticmethod
+    def _key_lock(namespace, symbol, interval):
+        key = (namespace, symbol.upper(), interval)
+        with BarStore._locks_guard:
+            if key not in BarStore._locks:
+                BarStore._locks[key] = threading.Lock()
+            return BarStore._locks[key]
+
+    @staticmethod
+    def _key_path(symbol, interval, namespace):
+        safe_symbol = re.sub(r"[^A-Za-z0-9._-]", "_", symbol.upper())
+        return BarStore.STORE_PATH / namespace / f"{safe_symbol}__{interval}.npz"
+
+    # --- Odczyt / zapis ---
+
+    @staticmethod
+    def load(symbol, interval, namespace="yfinance"):
+        path = BarStore._key_path(symbol, interval, namespace)
+        if not path.exists():
+            return None, {}
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                index = pd.to_datetime(data["index"], unit="ns")
+                if meta.get("tz"):
+                    index = index.tz_localize("UTC").tz_convert(meta["tz"])
+
+                df = pd.DataFrame(
+                    {col: data[col] for col in OHLCV_COLUMNS if col in data.files},
+                    index=index,
+                )
+            return df, meta
+        except Exception as e:
+            print(f"[BarStore] Error loading {path.name}: {e}")
+            return None, {}
+
+    @staticmethod
+    def save(symbol, interval, df, meta, namespace="yfinance"):
+        path = BarStore._key_path(symbol, interval, namespace)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tz = df.index.tz
+            meta = dict(meta, tz=str(tz) if tz is not None else "")
+
+            columns = {col: df[col].to_numpy(dtype=np.float64) for col in df.columns}
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    index=index_to_utc_ns(df.index),
+                    meta=np.array(json.dumps(meta)),
+                    **columns,
+                )
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"[BarStore] Error saving {path.name}: {e}")
+            return False
+
+    @staticmethod
+    def clear(symbol=None, interval=None, namespace="yfinance"):
+        if symbol and interval:
+            paths = [BarStore._key_path(symbol, interval, namespace)]
+        else:
+            paths = (BarStore.STORE_PATH / namespace).glob("*.npz")
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    # --- Pobieranie ---
+
+    @staticmethod
+    def _merge(stored, fresh):
+        """Dokleja świeże świece do zapisanych; None, jeśli serii nie da się połączyć."""
+        if stored is None or stored.empty:
+            return fresh
+        if fresh.empty:
+            return stored
+        if (stored.index.tz is None) != (fresh.index.tz is None):
+            # Zmiana strefy (np. inna wersja yfinance) - starych danych nie da się połączyć
+            return None
+
+        merged = pd.concat([stored, fresh])
+        merged = merged[~merged.index.duplicated(keep="last")]
+        return merged.sort_index()
+
+    @staticmethod
+    def get_bars(symbol, period, interval, provider=None):
+        """
+        Zwraca świece z okresu `period`, dociągając z sieci tylko brakujący fragment.
+        Równoległe wywołania dla tego samego klucza czekają na jedno pobranie.
+        """
+        provider = provider or get_provider()
+        symbol = symbol.upper()
+        key = (provider.name, symbol, "bars", interval, period)
+        return INFLIGHT.do(key, BarStore._get_bars, symbol, period, interval, provider)
+
+    @staticmethod
+    def _is_covered(stored, meta, window_start_ns):
+        return (
+            stored is not None
+            and not stored.empty
+            and meta.get("covered_from", np.iinfo(np.int64).max) <= window_start_ns
+            and index_to_utc_ns(stored.index)[-1] >= window_start_ns
+        )
+
+    @staticmethod
+    def _is_fresh(meta, interval, now):
+        if "updated_at" not in meta:
+            return False
+        max_age = min(INTERVAL_SECONDS.get(interval, BarStore.MAX_FRESH_SECONDS), BarStore.MAX_FRESH_SECONDS)
+        age = (now - datetime.fromisoformat(meta["updated_at"])).total_seconds()
+        return 0 <= age < max_age
+
+    @staticmethod
+    def _resample_from_cache(symbol, period, interval, provider, window_start_ns, now):
+        """
+        Buduje grubszy interwał z zapisanych drobniejszych świec, jeśli pokrywają okno.
+        Świeże źródło jest używane bez sieci; starsze dostaje tylko dociągnięcie końcówki.
+        """
+        namespace = provider.name
+        for source in RESAMPLE_SOURCES.get(interval, ()):
+            fine, fine_meta = BarStore.load(symbol, source, namespace)
+            if not BarStore._is_covered(fine, fine_meta, window_start_ns):
+                continue
+
+            if not BarStore._is_fresh(fine_meta, source, now):
+                BarStore.get_bars(symbol, period, source, provider)
+                fine, _ = BarStore.load(symbol, source, namespace)
+                if fine is None:
+                    continue
+
+            return slice_period(resample_ohlcv(fine, interval), period, now)
+        return None
+
+    @staticmethod
+    def _get_bars(symbol, period, interval, provider):
+        namespace = provider.name
+        now = provider.now()
+        window_start = now - period_to_timedelta(period)
+        window_start_ns = int(window_start.timestamp() * 1e9)
+
+        with BarStore._key_lock(namespace, symbol, interval):
+            stored, meta = BarStore.load(symbol, interval, namespace)
+
+            merged = None
+            if BarStore._is_covered(stored, meta, window_start_ns):
+                last_bar = stored.index[-1]
+                start = last_bar if last_bar.tz is not None else last_bar.strftime("%Y-%m-%d")
+                try:
+                    fresh = provider.get_history(symbol, interval, start=start)
+                except Exception as e:
+                    # Zapisane dane bez zmian i bez nowego updated_at - nie mogą uchodzić za świeże
+                    print(f"[BarStore] Top-up failed for {symbol} {interval}: {e}")
+                    return slice_period(stored, period, now)
+                if fresh.empty:
+                    # Dociągnięcie zaczyna się od ostatniej zapisanej świecy, więc pusty wynik to błąd
+                    # (yf.download nie rzuca wyjątku) - tak samo bez zapisu i nowego updated_at
+                    print(f"[BarStore] Top-up returned no bars for {symbol} {interval}")
+                    return slice_period(stored, period, now)
+                merged = BarStore._merge(stored, fresh)
+                if merged is None:
+                    # Zapis samej końcówki ze starym covered_from udawałby pełne okno - pobieramy od nowa
+                    print(f"[BarStore] Stored bars for {symbol} {interval} incompatible, refetching")
+                    BarStore.clear(symbol, interval, namespace)
+
+            if merged is None:
+                resampled = BarStore._resample_from_cache(
+                    symbol, period, interval, provider, window_start_ns, now
+                )
+                if resampled is not None and not resampled.empty:
+                    return resampled
+
+                # Brak ciągłości z zapisanymi danymi - pełne pobranie zastępuje plik.
+                # Interwały źródłowe pobieramy od razu szerzej, żeby pokryć interwały z nich składane.
+                fetch_period = SOURCE_FETCH_PERIODS.get(interval, period)
+                if period_to_timedelta(fetch_period) < period_to_timedelta(period):
+                    fetch_period = period
+
+                merged = provider.get_history(symbol, interval, period=fetch_period)
+                if merged.empty:
+                    return merged
+                covered_from = now - period_to_timedelta(fetch_period)
+                meta = {"covered_from": int(covered_from.timestamp() * 1e9)}
+
+            meta["updated_at"] = now.isoformat()
+            BarStore.save(symbol, interval, merged, meta, namespace)
+
+        return slice_period(merged, period, now)
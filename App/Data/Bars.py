@@ -0,0 +1,90 @@
+import re
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Przybliżona długość okresów yfinance ("2d", "2wk", "3mo", "1y", ...)
+PERIOD_UNITS = {
+    "d": timedelta(days=1),
+    "wk": timedelta(weeks=1),
+    "mo": timedelta(days=31),
+    "y": timedelta(days=366),
+}
+
+# "Nd" w yfinance oznacza N sesji, nie N dni kalendarzowych (weekendy, święta)
+SESSION_SLACK = timedelta(days=4)
+
+
+def parse_period(period):
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    count, unit = int(match.group(1)), match.group(2)
+    return count, unit
+
+
+def period_to_timedelta(period):
+    count, unit = parse_period(period)
+    delta = PERIOD_UNITS[unit] * count
+    if unit == "d":
+        delta += SESSION_SLACK
+    return delta
+
+
+def index_to_utc_ns(index):
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    # Jawnie w ns - pandas 2+ może trzymać indeks w innej rozdzielczości (np. us)
+    return np.asarray(index, dtype="datetime64[ns]").view(np.int64)
+
+
+def timestamp_to_utc_ns(value):
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.value
+
+
+def normalize_ohlcv(df):
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = [c[0] for c in df.columns]
+
+    df = df[[c for c in OHLCV_COLUMNS if c in df.columns]].copy()
+    for col in df.columns:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    df = df[~df.index.duplicated(keep="last")]
+    return df.sort_index()
+
+
+def slice_period(df, period, now):
+    count, unit = parse_period(period)
+    if unit == "d":
+        dates = pd.Index(df.index.date).unique()
+        if len(dates) > count:
+            return df[df.index.date >= dates[-count]]
+        return df
+
+    start_ns = timestamp_to_utc_ns(now - period_to_timedelta(period))
+    return df[index_to_utc_ns(df.index) >= start_ns]
+
+
+def bars_to_arrays(df):
+    """Świece jako słownik tablic NumPy (index w ns UTC + kolumny) - lekki do przesłania między procesami."""
+    tz = df.index.tz
+    arrays = {col: df[col].to_numpy(dtype=np.float64) for col in df.columns}
+    return {"index": index_to_utc_ns(df.index), "tz": str(tz) if tz is not None else "", "columns": arrays}
+
+
+def arrays_to_bars(payload):
+    index = pd.to_datetime(payload["index"], unit="ns")
+    if payload["tz"]:
+        index = index.tz_localize("UTC").tz_convert(payload["tz"])
+    return pd.DataFrame(payload["columns"], index=index)
@@ -0,0 +1,106 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FetchEngine:
+    """
+    Silnik równoległych zapytań sieciowych oparty o asyncio.
+
+    Pętla asyncio działa we własnym wątku, a blokujące wywołania providerów
+    (yfinance) wykonywane są w puli wątków. Liczbę jednoczesnych zapytań
+    ogranicza globalny semafor oraz osobny semafor na każdy host.
+    Wyniki trafiają do wywołującego jako concurrent.futures.Future.
+    """
+
+    DEFAULT_CONCURRENCY = 16
+    DEFAULT_PER_HOST = 8
+
+    def __init__(self, max_concurrency=DEFAULT_CONCURRENCY, per_host_limit=DEFAULT_PER_HOST):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="fetch-engine")
+        self._loop = asyncio.new_event_loop()
+        self._global_sem = None
+        self._host_sems = {}
+
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="fetch-engine-loop", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        self._loop.run_forever()
+
+    def _host_sem(self, host):
+        if host not in self._host_sems:
+            self._host_sems[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_sems[host]
+
+    async def _call(self, func, args, kwargs, host):
+        async with self._global_sem:
+            async with self._host_sem(host):
+                future = self._executor.submit(functools.partial(func, *args, **kwargs))
+                try:
+                    return await asyncio.wrap_future(future, loop=self._loop)
+                except asyncio.CancelledError:
+                    if not future.cancel():
+                        # Wątek puli liczy dalej - semafory zwalniane dopiero po jego końcu,
+                        # inaczej anulowanie i ponowne zlecenie przekroczyłyby limity
+                        await asyncio.wait([asyncio.wrap_future(future, loop=self._loop)])
+                    raise
+
+    async def _gather(self, calls, host):
+        return await asyncio.gather(
+            *(self._call(func, args, kwargs, host) for func, args, kwargs in calls),
+            return_exceptions=True,
+        )
+
+    # --- API ---
+
+    def submit(self, func, *args, host="default", **kwargs):
+        """Zleca pojedyncze wywołanie func(*args, **kwargs). Zwraca Future."""
+        return asyncio.run_coroutine_threadsafe(self._call(func, args, kwargs, host), self._loop)
+
+    def run(self, func, *args, **kwargs):
+        """Wywołanie bez sieci (np. obliczenia) w puli wątków silnika, poza semaforami hostów."""
+        return self._executor.submit(func, *args, **kwargs)
+
+    def gather(self, calls, host="default"):
+        """
+        Zleca wiele wywołań naraz; `calls` to lista (func, args, kwargs).
+        Future zwraca listę wyników w tej samej kolejności (wyjątki jako wartości).
+        """
+        return asyncio.run_coroutine_threadsafe(self._gather(list(calls), host), self._loop)
+
+    def shutdown(self):
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_fetch_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine()
+        return _engine
+
+
+def shutdown_fetch_engine():
+    # Przy zamykaniu aplikacji - tylko jeśli silnik powstał; wątki puli nie są daemon
+    global _engine
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.shutdown()
@@ -0,0 +1,161 @@
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ExchangeSession:
+    """Sesja giełdy w jej lokalnej strefie czasowej (bez świąt i przerw obiadowych)."""
+
+    def __init__(self, tz_name, open_time, close_time, weekdays=(0, 1, 2, 3, 4)):
+        self.tz = ZoneInfo(tz_name)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.weekdays = weekdays
+
+    def is_open(self, now):
+        local = now.astimezone(self.tz)
+        return (
+            local.weekday() in self.weekdays
+            and self.open_time <= local.time() < self.close_time
+        )
+
+    def next_open(self, now):
+        local = now.astimezone(self.tz)
+        for days_ahead in range(8):
+            day = local.date() + timedelta(days=days_ahead)
+            if day.weekday() not in self.weekdays:
+                continue
+            candidate = datetime.combine(day, self.open_time, tzinfo=self.tz)
+            if candidate > local:
+                return candidate.astimezone(timezone.utc)
+        return None
+
+
+class AlwaysOpenSession:
+    """Kryptowaluty, waluty i nieznane rynki - odświeżane zawsze."""
+
+    def is_open(self, now):
+        return True
+
+    def next_open(self, now):
+        return now
+
+
+NEW_YORK = ExchangeSession("America/New_York", time(9, 30), time(16, 0))
+LONDON = ExchangeSession("Europe/London", time(8, 0), time(16, 30))
+FRANKFURT = ExchangeSession("Europe/Berlin", time(9, 0), time(17, 30))
+PARIS = ExchangeSession("Europe/Paris", time(9, 0), time(17, 30))
+TOKYO = ExchangeSession("Asia/Tokyo", time(9, 0), time(15, 30))
+SHANGHAI = ExchangeSession("Asia/Shanghai", time(9, 30), time(15, 0))
+HONG_KONG = ExchangeSession("Asia/Hong_Kong", time(9, 30), time(16, 0))
+ALWAYS_OPEN = AlwaysOpenSession()
+
+INDEX_SESSIONS = {
+    "^GSPC": NEW_YORK,
+    "^DJI": NEW_YORK,
+    "^IXIC": NEW_YORK,
+    "^FTSE": LONDON,
+    "^GDAXI": FRANKFURT,
+    "^FCHI": PARIS,
+    "^N225": TOKYO,
+    "000001.SS": SHANGHAI,
+}
+
+SUFFIX_SESSIONS = {
+    ".L": LONDON,
+    ".DE": FRANKFURT,
+    ".F": FRANKFURT,
+    ".PA": PARIS,
+    ".T": TOKYO,
+    ".SS": SHANGHAI,
+    ".SZ": SHANGHAI,
+    ".HK": HONG_KONG,
+}
+
+
+def session_for(symbol):
+    symbol = symbol.upper()
+    if symbol in INDEX_SESSIONS:
+        return INDEX_SESSIONS[symbol]
+    if "-" in symbol or symbol.endswith("=X") or symbol.endswith("=F"):
+        return ALWAYS_OPEN
+    for suffix, session in SUFFIX_SESSIONS.items():
+        if symbol.endswith(suffix):
+            return session
+    if symbol.startswith("^") or "." in symbol:
+        return ALWAYS_OPEN
+    # Symbol bez sufiksu - rynek amerykański
+    return NEW_YORK
+
+
+class MarketHoursScheduler(QObject):
+    """
+    Zastępuje stały QTimer: w trakcie sesji emituje refresh_requested co
+    `poll_interval_ms` z listą otwartych rynków (plus jednorazowo tych, które
+    właśnie zamknięto, żeby złapać kurs zamknięcia), a poza sesją usypia się
+    do najbliższego otwarcia.
+    """
+
+    refresh_requested = Signal(list)
+
+    # Górny limit snu - zabezpiecza przed zmianą czasu systemowego / uśpieniem komputera
+    MAX_SLEEP_MS = 6 * 3600 * 1000
+    WAKE_UP_MARGIN_MS = 1000
+
+    def __init__(self, symbols, poll_interval_ms, parent=None):
+        super().__init__(parent)
+        self.symbols = list(symbols)
+        self.poll_interval_ms = poll_interval_ms
+        self.sessions = {symbol: session_for(symbol) for symbol in self.symbols}
+        self._was_open = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @staticmethod
+    def _now():
+        return datetime.now(timezone.utc)
+
+    def open_symbols(self, now=None):
+        now = now or self._now()
+        return [s for s in self.symbols if self.sessions[s].is_open(now)]
+
+    def start(self):
+        self._was_open = set(self.open_symbols())
+        self._schedule()
+
+    def stop(self):
+        self._timer.stop()
+
+    def isActive(self):
+        return self._timer.isActive()
+
+    def _on_timeout(self):
+        now = self._now()
+        open_now = set(self.open_symbols(now))
+        just_closed = self._was_open - open_now
+        self._was_open = open_now
+
+        due = [s for s in self.symbols if s in open_now or s in just_closed]
+        if due:
+            self.refresh_requested.emit(due)
+        self._schedule(now)
+
+    def _schedule(self, now=None):
+        now = now or self._now()
+        if self.open_symbols(now):
+            self._timer.start(self.poll_interval_ms)
+            return
+
+        next_opens = [
+            session.next_open(now) for session in self.sessions.values()
+        ]
+        next_opens = [t for t in next_opens if t is not None]
+        if not next_opens:
+            self._timer.start(self.MAX_SLEEP_MS)
+            return
+
+        delay_ms = int((min(next_opens) - now).total_seconds() * 1000) + self.WAKE_UP_MARGIN_MS
+        self._timer.start(max(self.poll_interval_ms, min(delay_ms, self.MAX_SLEEP_MS)))
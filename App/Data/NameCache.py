@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from App.Data.Providers import get_provider
+from Launcher.ConfigManager import ConfigManager
+
+
+class NameCache:
+    """
+    Trwały cache nazw spółek (longName/shortName) z TTL dla każdego wpisu.
+
+    Odczyt zawsze idzie z pamięci. Przeterminowany wpis jest zwracany od razu,
+    a jego odświeżenie odbywa się w tle; z sieci synchronicznie pobierane są
+    tylko symbole, których jeszcze nie znamy.
+    """
+
+    CACHE_PATH = ConfigManager.APP_FOLDER_PATH / "Cache" / "names.json"
+    DEFAULT_TTL = 7 * 24 * 3600
+    # Nieudane pobranie zapamiętujemy krócej, żeby nie odpytywać Yahoo przy każdym odświeżeniu
+    FAILED_TTL = 3600
+    MAX_WORKERS = 4
+
+    _entries = None
+    _lock = threading.RLock()
+    _save_lock = threading.Lock()
+    _executor = None
+    _refreshing = set()
+
+    # --- Pamięć / dysk ---
+
+    @classmethod
+    def _ensure_loaded(cls):
+        if cls._entries is not None:
+            return
+        with cls._lock:
+            if cls._entries is not None:
+                return
+            entries = {}
+            if cls.CACHE_PATH.exists():
+                try:
+                    with open(cls.CACHE_PATH, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+                except Exception as e:
+                    print(f"[NameCache] Error loading cache: {e}")
+            cls._entries = entries
+
+    @classmethod
+    def _save(cls):
+        try:
+            cls.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with cls._save_lock:
+                with cls._lock:
+                    payload = json.dumps(cls._entries, ensure_ascii=False, indent=1)
+                tmp_path = cls.CACHE_PATH.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, cls.CACHE_PATH)
+        except Exception as e:
+            print(f"[NameCache] Error saving cache: {e}")
+
+    @classmethod
+    def _get_executor(cls):
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.MAX_WORKERS, thread_name_prefix="name-cache"
+                )
+            return cls._executor
+
+    @staticmethod
+    def _is_fresh(entry, now):
+        return now - entry["fetched_at"] < entry.get("ttl", NameCache.DEFAULT_TTL)
+
+    # --- Pobieranie ---
+
+    @staticmethod
+    def _fetch_name(symbol):
+        return get_provider().get_company_name(symbol)
+
+    @classmethod
+    def _refresh(cls, symbol):
+        try:
+            name = cls._fetch_name(symbol)
+        except Exception as e:
+            print(f"[NameCache] Error fetching name for {symbol}: {e}")
+            name = None
+
+        with cls._lock:
+            cls._refreshing.discard(symbol)
+            if name:
+                cls._entries[symbol] = {"name": name, "fetched_at": time.time(), "ttl": cls.DEFAULT_TTL}
+            else:
+                # Zachowaj poprzednią nazwę, jeśli była - przesuń tylko termin ponowienia
+                previous = cls._entries.get(symbol, {}).get("name", symbol)
+                cls._entries[symbol] = {"name": previous, "fetched_at": time.time(), "ttl": cls.FAILED_TTL}
+            return cls._entries[symbol]["name"]
+
+    @classmethod
+    def _refresh_many(cls, symbols):
+        """Pobiera nazwy równolegle i zapisuje plik raz dla całej partii; zwraca {symbol: nazwa}."""
+        names = dict(zip(symbols, cls._get_executor().map(cls._refresh, symbols)))
+        cls._save()
+        return names
+
+    @classmethod
+    def _schedule_refresh(cls, symbols):
+        with cls._lock:
+            pending = [s for s in symbols if s not in cls._refreshing]
+            cls._refreshing.update(pending)
+        if pending:
+            # Osobny wątek czeka na partię - w puli executora map mógłby się zakleszczyć
+            threading.Thread(
+                target=cls._refresh_many, args=(pending,), name="name-cache-refresh", daemon=True
+            ).start()
+
+    # --- API ---
+
+    @classmethod
+    def set_name(cls, symbol, name, ttl=None):
+        cls._ensure_loaded()
+        with cls._lock:
+            cls._entries[symbol.upper()] = {
+                "name": name,
+                "fetched_at": time.time(),
+                "ttl": ttl if ttl is not None else cls.DEFAULT_TTL,
+            }
+        cls._save()
+
+    @classmethod
+    def get_names(cls, symbols, fetch_missing=True):
+        """
+        Zwraca {symbol: nazwa} dla wielu symboli naraz.
+        Nieznane symbole są pobierane równolegle (fetch_missing=True) albo
+        zwracane jako sam symbol i uzupełniane w tle (fetch_missing=False).
+        """
+        cls._ensure_loaded()
+        now = time.time()
+        result, missing, stale = {}, [], []
+
+        with cls._lock:
+            for symbol in symbols:
+                key = symbol.upper()
+                entry = cls._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                    result[symbol] = symbol
+                    continue
+                result[symbol] = entry["name"]
+                if not cls._is_fresh(entry, now):
+                    stale.append(key)
+
+        if stale:
+            cls._schedule_refresh(stale)
+
+        if missing:
+            if fetch_missing:
+                fetched = cls._refresh_many(missing)
+                for symbol in symbols:
+                    if symbol.upper() in fetched:
+                        result[symbol] = fetched[symbol.upper()]
+            else:
+                cls._schedule_refresh(missing)
+
+        return result
+
+    @classmethod
+    def get_name(cls, symbol, fetch_missing=True):
+        return cls.get_names([symbol], fetch_missing=fetch_missing)[symbol]
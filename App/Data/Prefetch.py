@@ -0,0 +1,94 @@
+import re
+
+from PySide6.QtCore import QObject, QTimer
+
+from App.Data.FetchEngine import get_fetch_engine
+from App.Data.NameCache import NameCache
+from App.Data.Providers import get_provider
+
+
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9^][A-Z0-9.^=-]{0,14}$")
+
+
+def _prefetch(symbol, period, interval, provider):
+    # BarStore (pandas) dopiero w wątku FetchEngine, nie przy imporcie strony
+    from App.Data.BarStore import BarStore
+
+    BarStore.get_bars(symbol, period, interval, provider=provider)
+    NameCache.get_name(symbol)
+
+
+class Prefetcher(QObject):
+    """
+    Spekulatywne pobieranie historii, gdy użytkownik wpisuje symbol.
+
+    Po DEBOUNCE_MS bez zmian w polu symbolu dane trafiają do BarStore (i NameCache),
+    z których potem czyta PredictionWorker. Jeśli prefetch jeszcze trwa, worker
+    podpina się pod niego przez INFLIGHT zamiast pobierać drugi raz. Zmiana symbolu
+    anuluje poprzedni, nieaktualny prefetch.
+    """
+
+    DEBOUNCE_MS = 400
+
+    def __init__(self, parent=None, provider=None, engine=None):
+        super().__init__(parent)
+        self.provider = provider or get_provider()
+        self.engine = engine or get_fetch_engine()
+        self._pending = None
+        self._current = None
+        self._future = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._start_prefetch)
+
+    def schedule(self, symbol, period, interval):
+        symbol = symbol.strip().upper()
+        if not SYMBOL_PATTERN.match(symbol):
+            self.cancel()
+            return
+
+        request = (symbol, period, interval)
+        if request == self._current and self._future is not None and not self._future.cancelled():
+            self._timer.stop()
+            return
+
+        self._pending = request
+        self._timer.start(self.DEBOUNCE_MS)
+
+    def stop_debounce(self):
+        """Użytkownik kliknął Oblicz - worker pobierze dane sam, trwający prefetch zostaje."""
+        self._timer.stop()
+        self._pending = None
+
+    def cancel(self):
+        self.stop_debounce()
+        if self._future is not None and not self._future.done():
+            # Zadanie czekające na semafor zostaje porzucone; już wysłane zapytanie
+            # kończy się w tle i tylko zasila cache
+            self._future.cancel()
+        self._future = None
+        self._current = None
+
+    def _start_prefetch(self):
+        if self._pending is None:
+            return
+
+        if self._future is not None and not self._future.done():
+            self._future.cancel()
+
+        symbol, period, interval = self._pending
+        self._current = self._pending
+        self._pending = None
+        self._future = self.engine.submit(
+            _prefetch, symbol, period, interval, self.provider, host=self.provider.host
+        )
+        self._future.add_done_callback(self._on_done)
+
+    @staticmethod
+    def _on_done(future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"[Prefetch] {error}")
@@ -0,0 +1,456 @@
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from App.Data.SingleFlight import INFLIGHT
+
+# pandas, yfinance i App.Data.Bars (pandas) importowane są w metodach - moduł ładuje się
+# przy starcie aplikacji, a pierwsze zapytanie i tak idzie z wątku FetchEngine
+
+
+class QuoteRecord(NamedTuple):
+    symbol: str
+    last_price: float
+    previous_close: float
+    currency: str
+
+    @property
+    def change_pct(self):
+        if not self.previous_close:
+            return 0.0
+        return (self.last_price - self.previous_close) / self.previous_close * 100
+
+
+class MarketDataProvider:
+    """
+    Źródło danych rynkowych, z którego korzystają workery (MarketWorker, PredictionWorker).
+    Wszystkie metody zwracają świece w formacie normalize_ohlcv().
+    """
+
+    name = "base"
+    # Klucz limitu per-host w FetchEngine
+    host = "default"
+
+    def now(self):
+        return datetime.now(timezone.utc)
+
+    def get_history(self, symbol, interval, period=None, start=None):
+        raise NotImplementedError
+
+    def get_history_batch(self, symbols, period, interval):
+        return {symbol: self.get_history(symbol, interval, period=period) for symbol in symbols}
+
+    def get_company_name(self, symbol):
+        raise NotImplementedError
+
+    def get_quote(self, symbol):
+        """Zwraca QuoteRecord (ostatnia cena, poprzednie zamknięcie, waluta)."""
+        raise NotImplementedError
+
+    def get_quotes(self, symbols):
+        """
+        Zwraca {symbol: QuoteRecord} dla wielu symboli; symbole bez notowania są pomijane.
+        Providery z zapytaniem zbiorczym nadpisują tę metodę.
+        """
+        quotes = {}
+        for symbol in dict.fromkeys(symbols):
+            try:
+                quotes[symbol] = self.get_quote(symbol)
+            except Exception as e:
+                print(f"[Provider] No quote for {symbol}: {e}")
+        return quotes
+
+
+class YFinanceProvider(MarketDataProvider):
+    name = "yfinance"
+    host = "query2.finance.yahoo.com"
+
+    # Ten sam host co świece - semafor hosta w FetchEngine obejmuje oba rodzaje zapytań
+    QUOTE_URL = f"https://{host}/v7/finance/quote"
+    # Tyle symboli mieści się w jednym zapytaniu v7/finance/quote
+    QUOTE_BATCH_SIZE = 50
+    # Zerowane po pierwszej niezgodności wewnętrznego API yfinance
+    _quote_api = True
+
+    @staticmethod
+    def _split_batch(df, symbols):
+        import pandas as pd
+        from App.Data.Bars import normalize_ohlcv
+
+        frames = {}
+        for symbol in symbols:
+            if df.empty:
+                frames[symbol] = normalize_ohlcv(None)
+            elif not isinstance(df.columns, pd.MultiIndex):
+                frames[symbol] = normalize_ohlcv(df)
+            elif symbol in df.columns.get_level_values(1):
+                frames[symbol] = normalize_ohlcv(df.xs(symbol, axis=1, level=1))
+            elif symbol in df.columns.get_level_values(0):
+                frames[symbol] = normalize_ohlcv(df[symbol])
+            else:
+                frames[symbol] = normalize_ohlcv(None)
+        return frames
+
+    def get_history(self, symbol, interval, period=None, start=None):
+        import yfinance as yf
+        from App.Data.Bars import normalize_ohlcv
+
+        if period is not None:
+            df = yf.download(symbol, period=period, interval=interval, progress=False)
+        else:
+            df = yf.download(symbol, start=start, interval=interval, progress=False)
+        return normalize_ohlcv(df)
+
+    def get_history_batch(self, symbols, period, interval):
+        import yfinance as yf
+
+        symbols = list(dict.fromkeys(symbols))
+        df = yf.download(symbols, period=period, interval=interval, progress=False, threads=True)
+        return self._split_batch(df, symbols)
+
+    def get_company_name(self, symbol):
+        import yfinance as yf
+
+        info = yf.Ticker(symbol).info
+        return info.get("longName") or info.get("shortName")
+
+    def get_quote(self, symbol):
+        quote = self.get_quotes([symbol]).get(symbol)
+        if quote is None:
+            raise ValueError(f"No quote for {symbol}")
+        return quote
+
+    def _quote_batch(self, batch):
+        from yfinance.data import YfData
+
+        return YfData().get_raw_json(self.QUOTE_URL, params={"symbols": ",".join(batch), "formatted": "false"})
+
+    def get_quotes(self, symbols):
+        # Jedno zapytanie v7/finance/quote na QUOTE_BATCH_SIZE symboli: same pola notowania,
+        # bez DataFrame'ów. Sesję z ciasteczkiem i crumbem dzieli z resztą yfinance.
+        # (fast_info i history pobierają pod spodem świece osobno dla każdego symbolu)
+        # YfData nie jest publicznym API - wersja przypięta w requirements.txt; gdy mimo to
+        # się zmieni, ścieżka jest wyłączana raz, a MarketQuotes bierze dzienne zamknięcia
+        if not YFinanceProvider._quote_api:
+            return {}
+        requested = {symbol.upper(): symbol for symbol in symbols}
+        if not requested:
+            return {}
+        batch = list(requested)
+        batches = [
+            batch[start:start + self.QUOTE_BATCH_SIZE]
+            for start in range(0, len(batch), self.QUOTE_BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            try:
+                responses = [self._quote_batch(batches[0])]
+            except Exception as e:
+                responses = [e]
+        else:
+            from App.Data.FetchEngine import get_fetch_engine
+
+            # Paczki równolegle - czas to najwolniejsze zapytanie, a nie suma
+            responses = get_fetch_engine().gather(
+                [(self._quote_batch, (chunk,), {}) for chunk in batches], host=self.host
+            ).result()
+
+        quotes = {}
+        errors = []
+        for response in responses:
+            if isinstance(response, (ImportError, AttributeError, TypeError)):
+                YFinanceProvider._quote_api = False
+                print(f"[YFinanceProvider] Quote API unavailable, using daily closes from now on: {response}")
+                return quotes
+            if isinstance(response, Exception):
+                errors.append(response)
+                continue
+            for item in (response.get("quoteResponse") or {}).get("result") or []:
+                symbol = requested.get(str(item.get("symbol", "")).upper())
+                last_price = item.get("regularMarketPrice")
+                previous_close = item.get("regularMarketPreviousClose")
+                if symbol is None or last_price is None or previous_close is None:
+                    continue
+                quotes[symbol] = QuoteRecord(
+                    symbol, float(last_price), float(previous_close), item.get("currency") or ""
+                )
+        if errors and len(errors) == len(responses):
+            raise errors[0]
+        # Symbole z nieudanych paczek MarketQuotes uzupełnia dziennymi zamknięciami
+        return quotes
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Odtwarza nagrane wcześniej dane z katalogu:
+        manifest.json                 - {"recorded_at": ISO, "timezones": {plik: tz}}
+        names.json                    - {symbol: nazwa}
+        quotes.json                   - {symbol: [ostatnia cena, poprzednie zamknięcie, waluta]}
+        history/<SYMBOL>__<int>.csv   - świece OHLCV, indeks w UTC
+
+    Zegar providera to chwila nagrania, więc okresy ("3mo", "2d") wycinane są tak,
+    jak w dniu nagrania. `latency` i `jitter` (sekundy) symulują czas odpowiedzi sieci.
+    """
+
+    name = "replay"
+    host = "replay"
+
+    def __init__(self, root, latency=0.0, jitter=0.0):
+        import pandas as pd
+
+        self.root = Path(root)
+        self.latency = latency
+        self.jitter = jitter
+        self._frames = {}
+        self._lock = threading.Lock()
+
+        manifest = self._read_json(self.root / "manifest.json")
+        self.recorded_at = (
+            pd.Timestamp(manifest["recorded_at"]).to_pydatetime()
+            if "recorded_at" in manifest else None
+        )
+        self.timezones = manifest.get("timezones", {})
+        self.names = self._read_json(self.root / "names.json")
+        self.quotes = self._read_json(self.root / "quotes.json")
+
+    @staticmethod
+    def _read_json(path):
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _file_name(symbol, interval):
+        safe_symbol = re.sub(r"[^A-Za-z0-9._-]", "_", symbol.upper())
+        return f"{safe_symbol}__{interval}.csv"
+
+    def _simulate_latency(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _load(self, symbol, interval):
+        import pandas as pd
+        from App.Data.Bars import normalize_ohlcv
+
+        file_name = self._file_name(symbol, interval)
+        with self._lock:
+            if file_name in self._frames:
+                return self._frames[file_name]
+
+        path = self.root / "history" / file_name
+        if path.exists():
+            df = pd.read_csv(path, index_col=0)
+            df.index = pd.to_datetime(df.index, utc=True)
+            tz = self.timezones.get(file_name, "")
+            df.index = df.index.tz_convert(tz) if tz else df.index.tz_localize(None)
+            df = normalize_ohlcv(df)
+        else:
+            df = normalize_ohlcv(None)
+
+        with self._lock:
+            self._frames[file_name] = df
+        return df
+
+    def now(self):
+        return self.recorded_at or super().now()
+
+    def get_history(self, symbol, interval, period=None, start=None):
+        from App.Data.Bars import slice_period, index_to_utc_ns, timestamp_to_utc_ns
+
+        self._simulate_latency()
+        df = self._load(symbol, interval)
+        if df.empty:
+            return df.copy()
+        if period is not None:
+            return slice_period(df, period, self.now()).copy()
+        return df[index_to_utc_ns(df.index) >= timestamp_to_utc_ns(start)].copy()
+
+    def get_history_batch(self, symbols, period, interval):
+        from App.Data.Bars import slice_period
+
+        # Jedno zapytanie zbiorcze = jedno opóźnienie
+        self._simulate_latency()
+        frames = {}
+        for symbol in dict.fromkeys(symbols):
+            df = self._load(symbol, interval)
+            frames[symbol] = slice_period(df, period, self.now()).copy() if not df.empty else df.copy()
+        return frames
+
+    def get_company_name(self, symbol):
+        self._simulate_latency()
+        return self.names.get(symbol.upper())
+
+    def _quote(self, symbol):
+        import pandas as pd
+
+        quote = self.quotes.get(symbol.upper())
+        if quote is not None:
+            return QuoteRecord(symbol, float(quote[0]), float(quote[1]), quote[2])
+
+        # Brak nagranego notowania - dwa ostatnie zamknięcia z dziennych świec
+        closes = self._load(symbol, "1d").get("Close", pd.Series(dtype=float)).dropna()
+        if closes.empty:
+            raise ValueError(f"No quote for {symbol}")
+        previous = closes.iloc[-2] if len(closes) >= 2 else closes.iloc[-1]
+        return QuoteRecord(symbol, float(closes.iloc[-1]), float(previous), "")
+
+    def get_quote(self, symbol):
+        self._simulate_latency()
+        return self._quote(symbol)
+
+    def get_quotes(self, symbols):
+        # Jedno zapytanie zbiorcze = jedno opóźnienie
+        self._simulate_latency()
+        quotes = {}
+        for symbol in dict.fromkeys(symbols):
+            try:
+                quotes[symbol] = self._quote(symbol)
+            except ValueError:
+                pass
+        return quotes
+
+    @staticmethod
+    def record(root, symbols, ranges, source=None):
+        """
+        Nagrywa dane z `source` (domyślnie YFinanceProvider) do katalogu `root`.
+        `ranges` to lista par (period, interval).
+        """
+        import pandas as pd
+        from App.Data.Bars import index_to_utc_ns
+
+        source = source or YFinanceProvider()
+        root = Path(root)
+        (root / "history").mkdir(parents=True, exist_ok=True)
+
+        manifest = ReplayProvider._read_json(root / "manifest.json")
+        timezones = manifest.get("timezones", {})
+        names = ReplayProvider._read_json(root / "names.json")
+        quotes = ReplayProvider._read_json(root / "quotes.json")
+
+        for symbol in symbols:
+            symbol = symbol.upper()
+            for period, interval in ranges:
+                df = source.get_history(symbol, interval, period=period)
+                if df.empty:
+                    print(f"[ReplayProvider] No data for {symbol} {interval}")
+                    continue
+                file_name = ReplayProvider._file_name(symbol, interval)
+                timezones[file_name] = str(df.index.tz) if df.index.tz is not None else ""
+                out = df.copy()
+                out.index = pd.to_datetime(index_to_utc_ns(df.index), unit="ns", utc=True)
+                out.to_csv(root / "history" / file_name, index_label="Datetime")
+            try:
+                names[symbol] = source.get_company_name(symbol) or symbol
+            except Exception as e:
+                print(f"[ReplayProvider] No name for {symbol}: {e}")
+            try:
+                quote = source.get_quote(symbol)
+                quotes[symbol] = [quote.last_price, quote.previous_close, quote.currency]
+            except Exception as e:
+                print(f"[ReplayProvider] No quote for {symbol}: {e}")
+
+        manifest["recorded_at"] = source.now().isoformat()
+        manifest["timezones"] = timezones
+        with open(root / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        with open(root / "names.json", "w", encoding="utf-8") as f:
+            json.dump(names, f, ensure_ascii=False, indent=1)
+        with open(root / "quotes.json", "w", encoding="utf-8") as f:
+            json.dump(quotes, f, indent=1)
+
+
+class CoalescingProvider(MarketDataProvider):
+    """
+    Nakładka na dowolnego providera: równoległe zapytania o te same dane
+    (symbol, rodzaj, interwał) są łączone w jedno przez wspólny rejestr INFLIGHT.
+    """
+
+    def __init__(self, inner, registry=None):
+        self.inner = inner
+        self.registry = registry or INFLIGHT
+        self.name = inner.name
+        self.host = inner.host
+
+    def now(self):
+        return self.inner.now()
+
+    def get_history(self, symbol, interval, period=None, start=None):
+        key = (self.name, symbol.upper(), "history", interval, period, str(start))
+        return self.registry.do(key, self.inner.get_history, symbol, interval, period=period, start=start)
+
+    def get_history_batch(self, symbols, period, interval):
+        # Klucze jak w get_history; wynik wraca pod każdą pisownią wywołującego
+        keys = {
+            symbol.upper(): (self.name, symbol.upper(), "history", interval, period, "None")
+            for symbol in symbols
+        }
+        tickers = {key: ticker for ticker, key in keys.items()}
+
+        def fetch(missing_keys):
+            frames = self.inner.get_history_batch([tickers[key] for key in missing_keys], period, interval)
+            return {key: frames.get(tickers[key]) for key in missing_keys}
+
+        results = self.registry.do_many(list(tickers), fetch)
+        return {symbol: results[keys[symbol.upper()]] for symbol in symbols}
+
+    def get_company_name(self, symbol):
+        key = (self.name, symbol.upper(), "name", None)
+        return self.registry.do(key, self.inner.get_company_name, symbol)
+
+    def get_quote(self, symbol):
+        key = (self.name, symbol.upper(), "quote", None)
+        quote = self.registry.do(key, self.inner.get_quote, symbol)
+        if quote is None:
+            # Dołączone do zapytania zbiorczego, które nie zwróciło tego symbolu
+            raise ValueError(f"No quote for {symbol}")
+        return quote
+
+    def get_quotes(self, symbols):
+        keys = {symbol.upper(): (self.name, symbol.upper(), "quote", None) for symbol in symbols}
+        tickers = {key: ticker for ticker, key in keys.items()}
+
+        def fetch(missing_keys):
+            quotes = self.inner.get_quotes([tickers[key] for key in missing_keys])
+            return {key: quotes.get(tickers[key]) for key in missing_keys}
+
+        results = self.registry.do_many(list(tickers), fetch)
+        return {
+            symbol: results[keys[symbol.upper()]] for symbol in symbols
+            if results[keys[symbol.upper()]] is not None
+        }
+
+
+# --- Aktywny provider ---
+
+_active_provider = None
+_provider_lock = threading.Lock()
+
+
+def _provider_from_env():
+    replay_dir = os.getenv("HOSSANNA_REPLAY_DIR")
+    if replay_dir:
+        latency_ms = float(os.getenv("HOSSANNA_REPLAY_LATENCY_MS", "0"))
+        jitter_ms = float(os.getenv("HOSSANNA_REPLAY_JITTER_MS", "0"))
+        return ReplayProvider(replay_dir, latency=latency_ms / 1000, jitter=jitter_ms / 1000)
+    return YFinanceProvider()
+
+
+def get_provider():
+    global _active_provider
+    with _provider_lock:
+        if _active_provider is None:
+            _active_provider = CoalescingProvider(_provider_from_env())
+        return _active_provider
+
+
+def set_provider(provider, coalesce=True):
+    global _active_provider
+    with _provider_lock:
+        _active_provider = CoalescingProvider(provider) if coalesce else provider
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from App.Data.Providers import get_provider
+
+
+class MarketQuotes:
+    # 5 dni kalendarzowych wystarcza na dwa ostatnie zamknięcia także po weekendzie/święcie
+    LOOKBACK_PERIOD = "5d"
+    # Starszych notowań z prefetch_quotes pierwsze odświeżenie panelu już nie używa [s]
+    PREFETCH_MAX_AGE = 60.0
+
+    _prefetched = {}
+    _prefetched_lock = threading.Lock()
+
+    @staticmethod
+    def fetch_last_closes(tickers, provider=None):
+        """
+        Pobiera dwa ostatnie zamknięcia dla wszystkich tickerów jednym zapytaniem.
+        Zwraca {ticker: {"price": float, "change": float}}.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        provider = provider or get_provider()
+        frames = provider.get_history_batch(tickers, MarketQuotes.LOOKBACK_PERIOD, "1d")
+
+        data = {}
+        for ticker in tickers:
+            # Giełdy mają różne dni sesyjne (np. BTC-USD w weekend) - każdy ticker osobno
+            df = frames.get(ticker)
+            series = df["Close"].dropna() if df is not None and "Close" in df.columns else []
+
+            if len(series) >= 2:
+                current = series.iloc[-1]
+                prev = series.iloc[-2]
+                change_pct = ((current - prev) / prev) * 100 if prev else 0.0
+                data[ticker] = {"price": float(current), "change": float(change_pct)}
+            elif len(series) == 1:
+                data[ticker] = {"price": float(series.iloc[-1]), "change": 0.0}
+            else:
+                data[ticker] = {"price": 0.0, "change": 0.0}
+
+        return data
+
+    @staticmethod
+    def fetch_quotes(tickers, provider=None):
+        """
+        Lekka ścieżka odświeżania: notowania wszystkich tickerów jednym zbiorczym
+        zapytaniem (QuoteRecord) zamiast info + historii. Zwraca {ticker: {"price", "change"}};
+        tickery bez notowania (albo wszystkie, gdy zapytanie padło) biorą dzienne zamknięcia.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prefetched = MarketQuotes._take_prefetched(tickers)
+        if len(prefetched) == len(tickers):
+            return {ticker: prefetched[ticker] for ticker in tickers}
+        provider = provider or get_provider()
+        requested, tickers = tickers, [ticker for ticker in tickers if ticker not in prefetched]
+        try:
+            quotes = provider.get_quotes(tickers)
+        except Exception as e:
+            print(f"Quote error, falling back to daily closes: {e}")
+            quotes = {}
+
+        data = {
+            ticker: {"price": quote.last_price, "change": quote.change_pct}
+            for ticker, quote in quotes.items()
+        }
+        missing = [ticker for ticker in tickers if ticker not in data]
+        if missing:
+            data.update(MarketQuotes.fetch_last_closes(missing, provider=provider))
+        data.update(prefetched)
+        return {ticker: data[ticker] for ticker in requested}
+
+    @staticmethod
+    def prefetch_quotes(tickers, provider=None):
+        """
+        fetch_quotes z wyprzedzeniem (w trakcie okna startowego). Wynik czeka na pierwsze
+        fetch_quotes o te tickery, które bierze go zamiast pytać sieć ponownie.
+        """
+        data = MarketQuotes.fetch_quotes(tickers, provider=provider)
+        now = time.monotonic()
+        with MarketQuotes._prefetched_lock:
+            for ticker, values in data.items():
+                # Zera to brak danych - pierwsze odświeżenie spróbuje jeszcze raz
+                if values["price"]:
+                    MarketQuotes._prefetched[ticker] = (now, values)
+        return data
+
+    @staticmethod
+    def _take_prefetched(tickers):
+        # Każdy wpis używany raz - kolejne odświeżenia zawsze pytają sieć
+        now = time.monotonic()
+        with MarketQuotes._prefetched_lock:
+            taken = {ticker: MarketQuotes._prefetched.pop(ticker) for ticker in tickers
+                     if ticker in MarketQuotes._prefetched}
+        return {
+            ticker: dict(values) for ticker, (fetched_at, values) in taken.items()
+            if now - fetched_at < MarketQuotes.PREFETCH_MAX_AGE
+        }
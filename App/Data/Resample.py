@@ -0,0 +1,81 @@
+import pandas as pd
+
+from App.Data.Bars import OHLCV_COLUMNS
+
+
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "60m": 3600,
+    "1h": 3600,
+    "90m": 5400,
+    "1d": 86400,
+}
+
+# Z jakich drobniejszych interwałów da się dokładnie złożyć dany interwał (kolejność = preferencja)
+RESAMPLE_SOURCES = {
+    "15m": ("5m",),
+    "30m": ("15m", "5m"),
+    "60m": ("15m", "5m"),
+    "1h": ("15m", "5m"),
+    "1wk": ("1d",),
+    "1mo": ("1d",),
+}
+
+# Pełne pobranie interwału źródłowego obejmuje od razu okna interwałów z niego składanych
+# (zakresy z PREDICTION_RANGES; 5m Yahoo udostępnia tylko za ostatnie 60 dni)
+SOURCE_FETCH_PERIODS = {
+    "5m": "2wk",
+    "1d": "5y",
+}
+
+AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+
+def _intraday_bins(index, seconds):
+    # Przedziały liczone od pierwszej świecy każdej sesji (np. 9:30, 10:30, ... dla NYSE),
+    # tak jak robi to Yahoo
+    rule = pd.Timedelta(seconds=seconds)
+    session_start = index.to_series().groupby(index.date).transform("min")
+    offset = (index.to_series() - session_start) // rule
+    return pd.DatetimeIndex(session_start + offset * rule)
+
+
+def _calendar_bins(index, interval):
+    tz = index.tz
+    local = index.tz_localize(None) if tz is not None else index
+    days = local.normalize()
+
+    if interval == "1wk":
+        bins = days - pd.to_timedelta(days.weekday, unit="D")
+    else:
+        bins = days - pd.to_timedelta(days.day - 1, unit="D")
+
+    return bins.tz_localize(tz) if tz is not None else bins
+
+
+def resample_ohlcv(df, interval):
+    """Składa świece OHLCV w grubszy interwał: open=first, high=max, low=min, close=last, volume=sum."""
+    if df.empty:
+        return df
+
+    if interval in INTERVAL_SECONDS:
+        bins = _intraday_bins(df.index, INTERVAL_SECONDS[interval])
+    elif interval in ("1wk", "1mo"):
+        bins = _calendar_bins(df.index, interval)
+    else:
+        raise ValueError(f"Unsupported resample interval: {interval}")
+
+    aggregations = {col: AGGREGATIONS[col] for col in OHLCV_COLUMNS if col in df.columns}
+    out = df.groupby(bins, sort=True).agg(aggregations)
+    out.index.name = df.index.name
+    return out
@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import Future
+
+
+def _share(result):
+    # Każdy oczekujący dostaje własną kopię (np. DataFrame), żeby nie modyfikować cudzych danych
+    return result.copy() if hasattr(result, "copy") else result
+
+
+class SingleFlight:
+    """
+    Rejestr zapytań w toku. Równoległe wywołania z tym samym kluczem
+    (np. (provider, symbol, rodzaj, interwał)) podpinają się pod jedno,
+    już trwające pobranie i dostają jego wynik albo wyjątek.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._inflight
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return _share(future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        future.set_result(result)
+        return result
+
+    def do_many(self, keys, func):
+        """
+        Wersja zbiorcza: `func(brakujące_klucze)` zwraca {klucz: wynik}.
+        Klucze już pobierane przez kogoś innego nie trafiają do `func`,
+        tylko czekają na tamte pobrania.
+        """
+        own, foreign = {}, {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._inflight:
+                    foreign[key] = self._inflight[key]
+                else:
+                    own[key] = self._inflight[key] = Future()
+
+        results = {}
+        if own:
+            try:
+                fetched = func(list(own))
+            except BaseException as e:
+                for future in own.values():
+                    future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    for key in own:
+                        self._inflight.pop(key, None)
+
+            for key, future in own.items():
+                future.set_result(fetched.get(key))
+                results[key] = fetched.get(key)
+
+        for key, future in foreign.items():
+            results[key] = _share(future.result())
+
+        return results
+
+
+# Wspólny rejestr dla strony głównej i predykcji
+INFLIGHT = SingleFlight()
@@ -0,0 +1,35 @@
+import importlib
+
+
+class PredictionCancelled(Exception):
+    """Predykcja anulowana przez użytkownika (wyjątek przechodzi z procesu puli do GUI)."""
+
+
+# Silniki do wyboru w panelu; wszystkie mają fit_predict(df, symbol, interval) z tym samym wynikiem.
+# Silniki TensorFlow ("pool") są importowane dopiero w procesie TrainingPool - GUI nie ładuje
+# TensorFlow ani sklearn. Silniki NumPy liczą milisekundy i idą prosto do puli wątków FetchEngine.
+PREDICTION_ENGINES = {
+    "LSTM": {"module": "App.Models.Predictor", "class": "StockPricePredictor", "pool": True},
+    # Model globalny potrzebuje też notowań ulubionych spółek
+    "Global LSTM": {"module": "App.Models.Predictor", "class": "GlobalPredictor", "pool": True, "uses_favorites": True},
+    "Ridge AR": {"module": "App.Models.Engines", "class": "RidgeARPredictor"},
+    "Holt": {"module": "App.Models.Engines", "class": "HoltPredictor"},
+}
+DEFAULT_ENGINE = "LSTM"
+
+# Limit czasu jednego treningu [s]; po nim zostają najlepsze dotąd wagi
+TIME_BUDGET = 30.0
+
+
+def uses_favorites(engine):
+    return PREDICTION_ENGINES[engine].get("uses_favorites", False)
+
+
+def uses_pool(engine):
+    return PREDICTION_ENGINES[engine].get("pool", False)
+
+
+def load_engine(engine):
+    """Zwraca klasę silnika; pierwszy import modułu LSTM ładuje TensorFlow (sekundy)."""
+    spec = PREDICTION_ENGINES[engine]
+    return getattr(importlib.import_module(spec["module"]), spec["class"])
@@ -0,0 +1,173 @@
+import time
+
+import numpy as np
+
+from App.Models.Windowing import make_sequence_windows
+
+
+def regression_metrics(actual, predicted):
+    """Ten sam słownik co StockPricePredictor.calculate_accuracy, liczony samym NumPy."""
+    actual = np.asarray(actual, dtype=np.float64)
+    predicted = np.asarray(predicted, dtype=np.float64)
+    if len(actual) == 0:
+        return {"accuracy": 0.0, "rmse": 0.0, "mape": 0.0}
+
+    errors = actual - predicted
+    rmse = float(np.sqrt(np.mean(errors ** 2)))
+    # Jak w sklearn: mianownik nie mniejszy niż epsilon
+    mape = float(np.mean(np.abs(errors) / np.maximum(np.abs(actual), np.finfo(np.float64).eps)) * 100)
+    return {"accuracy": max(0.0, 100 - mape), "rmse": rmse, "mape": mape}
+
+
+class NumpyPredictor:
+    """
+    Wspólna część lekkich silników bez TensorFlow.
+
+    Podział train/test i wynik fit_predict są takie same jak w StockPricePredictor:
+    model jest dopasowany do części uczącej, metryki to prognozy o krok naprzód
+    na części testowej, a forecast to prognoza `horizon` świec po ostatniej
+    (next_price = pierwsza z nich).
+    """
+
+    DEFAULT_CONFIG = {"train_split": 0.8}
+
+    def __init__(self, config=None, time_budget=None, cancel_event=None):
+        # time_budget i cancel_event tylko dla zgodności z StockPricePredictor - trening trwa milisekundy
+        self.config = dict(self.DEFAULT_CONFIG)
+        if config:
+            self.config.update(config)
+        self.accuracy_metrics = {}
+
+    def fit(self, closes):
+        raise NotImplementedError
+
+    def one_step_forecasts(self, closes, start):
+        """Prognozy closes[start:], każda tylko z danych sprzed danej świecy."""
+        raise NotImplementedError
+
+    def forecast_next(self, closes):
+        raise NotImplementedError
+
+    def forecast_path(self, closes, horizon):
+        """Rekurencyjnie: każda prognoza dopisywana jest do serii jako kolejne zamknięcie."""
+        path = np.empty(horizon)
+        extended = np.append(closes, path)
+        for step in range(horizon):
+            path[step] = self.forecast_next(extended[:len(closes) + step])
+            extended[len(closes) + step] = path[step]
+        return path
+
+    def fit_predict(self, df, symbol=None, interval=None, horizon=1):
+        started = time.perf_counter()
+        closes = df["Close"].to_numpy(dtype=np.float64)
+        train_size = int(len(closes) * self.config["train_split"])
+
+        self.fit(closes[:train_size])
+        predicted = self.one_step_forecasts(closes, train_size)
+        self.accuracy_metrics = regression_metrics(closes[train_size:], predicted)
+        forecast = self.forecast_path(closes, horizon)
+
+        return {
+            "next_price": float(forecast[0]),
+            "forecast": [float(value) for value in forecast],
+            **self.accuracy_metrics,
+            "training_mode": "full",
+            "fine_tune_time": 0.0,
+            "epochs_run": 0,
+            "train_time": time.perf_counter() - started,
+        }
+
+
+class RidgeARPredictor(NumpyPredictor):
+    """
+    Autoregresja grzbietowa na `lags` ostatnich zamknięciach.
+
+    Cechy i cel są względne do ostatniego zamknięcia w oknie (x / x_last - 1),
+    więc model nie zależy od poziomu ceny i radzi sobie z trendem.
+    """
+
+    DEFAULT_CONFIG = {"train_split": 0.8, "lags": 10, "alpha": 1e-3}
+
+    def __init__(self, config=None, time_budget=None, cancel_event=None):
+        super().__init__(config, time_budget, cancel_event)
+        self.weights = None
+        self.lags = None
+
+    @staticmethod
+    def _features(windows):
+        last = windows[:, -1:]
+        relative = windows[:, :-1] / last - 1
+        return np.hstack([relative, np.ones((len(windows), 1))]), last[:, 0]
+
+    def fit(self, closes):
+        self.lags = max(2, min(self.config["lags"], len(closes) // 3))
+        X, y = make_sequence_windows(closes[:, np.newaxis], self.lags)
+        features, last = self._features(X[:, :, 0])
+        target = y[:, 0] / last - 1
+
+        penalty = self.config["alpha"] * len(features) * np.eye(features.shape[1])
+        penalty[-1, -1] = 0.0  # bez kary dla wyrazu wolnego
+        self.weights = np.linalg.solve(features.T @ features + penalty, features.T @ target)
+
+    def _predict(self, windows):
+        features, last = self._features(windows)
+        return last * (1 + features @ self.weights)
+
+    def one_step_forecasts(self, closes, start):
+        X, _ = make_sequence_windows(closes[:, np.newaxis], self.lags)
+        # Okno i kończy się na świecy i + lags - 1 i prognozuje świecę i + lags
+        return self._predict(X[start - self.lags:, :, 0])
+
+    def forecast_next(self, closes):
+        return float(self._predict(closes[np.newaxis, -self.lags:])[0])
+
+
+class HoltPredictor(NumpyPredictor):
+    """
+    Podwójne wygładzanie wykładnicze Holta (poziom + trend).
+
+    alpha i beta są wybierane z siatki GRID x GRID po błędzie prognoz o krok
+    naprzód na części uczącej; wszystkie pary liczone jednocześnie (wektorowo).
+    """
+
+    GRID = np.linspace(0.05, 0.95, 10)
+
+    def __init__(self, config=None, time_budget=None, cancel_event=None):
+        super().__init__(config, time_budget, cancel_event)
+        self.alpha = None
+        self.beta = None
+
+    @staticmethod
+    def _smooth(closes, alpha, beta):
+        """Zwraca prognozy o krok naprzód (kształt (len(alpha), len(closes))) oraz końcowy poziom i trend."""
+        level = np.full(alpha.shape, closes[0])
+        trend = np.full(alpha.shape, closes[1] - closes[0] if len(closes) > 1 else 0.0)
+        forecasts = np.full(alpha.shape + (len(closes),), np.nan)
+
+        for t in range(1, len(closes)):
+            forecasts[..., t] = level + trend
+            new_level = alpha * closes[t] + (1 - alpha) * (level + trend)
+            trend = beta * (new_level - level) + (1 - beta) * trend
+            level = new_level
+
+        return forecasts, level, trend
+
+    def fit(self, closes):
+        alpha, beta = (grid.ravel() for grid in np.meshgrid(self.GRID, self.GRID))
+        forecasts, _, _ = self._smooth(closes, alpha, beta)
+        # Pierwsze dwie prognozy wynikają wprost z inicjalizacji trendu
+        sse = np.sum((forecasts[:, 2:] - closes[2:]) ** 2, axis=1)
+        best = int(np.argmin(sse))
+        self.alpha, self.beta = alpha[best], beta[best]
+
+    def one_step_forecasts(self, closes, start):
+        forecasts, _, _ = self._smooth(closes, np.array([self.alpha]), np.array([self.beta]))
+        return forecasts[0, start:]
+
+    def forecast_next(self, closes):
+        return float(self.forecast_path(closes, 1)[0])
+
+    def forecast_path(self, closes, horizon):
+        # Holt ma prognozę wielokrokową wprost: poziom + h * trend
+        _, level, trend = self._smooth(closes, np.array([self.alpha]), np.array([self.beta]))
+        return level[0] + trend[0] * np.arange(1, horizon + 1)
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from datetime import datetime
+
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+
+from App.Data.Bars import index_to_utc_ns
+from Launcher.ConfigManager import ConfigManager
+
+
+# Podbić przy każdej zmianie architektury sieci albo układu plików wpisu - stare wpisy przestaną pasować
+MODEL_VERSION = 2
+
+SCALER_ATTRIBUTES = ("data_min_", "data_max_", "data_range_", "scale_", "min_")
+
+
+class ModelRegistry:
+    """
+    Wytrenowane modele zapisane na dysku, kluczowane (symbol, interval, config).
+
+    Wpis to katalog wersji z wagami sieci, parametrami dopasowanego MinMaxScaler
+    oraz meta.json z odciskiem danych, na których model był uczony
+    (ostatnia świeca + hash zamknięć). Ten sam odcisk = ten sam model,
+    więc ponowna predykcja nie wymaga treningu.
+
+    Zapisywać mogą równolegle procesy TrainingPool, więc wpis nigdy nie jest
+    nadpisywany w miejscu: każdy zapis tworzy nowy katalog wersji, a plik
+    `current` w katalogu klucza jest na końcu atomowo podmieniany na jego nazwę.
+    Odczyt widzi zawsze kompletną wersję, a z dwóch równoległych zapisów wygrywa
+    późniejsza podmiana.
+    """
+
+    REGISTRY_PATH = ConfigManager.APP_FOLDER_PATH / "Models"
+    WEIGHTS_FILE = "model.weights.h5"
+    SCALER_FILE = "scaler.npz"
+    META_FILE = "meta.json"
+    CURRENT_FILE = "current"
+    # Starsze wersje są usuwane dopiero po tym czasie [s] - inny proces mógł je właśnie wczytywać
+    STALE_VERSION_SECONDS = 60
+
+    @staticmethod
+    def config_key(config):
+        payload = json.dumps({"version": MODEL_VERSION, **config}, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+    @staticmethod
+    def fingerprint(df):
+        """Odcisk danych uczących: czas ostatniej świecy, liczba świec i hash (index, Close)."""
+        index_ns = index_to_utc_ns(df.index)
+        closes = df["Close"].to_numpy(dtype=np.float64)
+
+        digest = hashlib.sha1()
+        digest.update(index_ns.tobytes())
+        digest.update(closes.tobytes())
+        last_ns = int(index_ns[-1]) if len(index_ns) else 0
+        return f"{last_ns}:{len(closes)}:{digest.hexdigest()[:16]}"
+
+    @staticmethod
+    def _key_dir(symbol, interval, config):
+        safe_symbol = re.sub(r"[^A-Za-z0-9._-]", "_", symbol.upper())
+        return ModelRegistry.REGISTRY_PATH / f"{safe_symbol}__{interval}__{ModelRegistry.config_key(config)}"
+
+    @staticmethod
+    def _prune(key_dir, current):
+        cutoff_ns = time.time_ns() - ModelRegistry.STALE_VERSION_SECONDS * 1_000_000_000
+        for version_dir in key_dir.iterdir():
+            match = re.fullmatch(r"v(\d+)-\d+", version_dir.name)
+            if version_dir.is_dir() and match and version_dir.name != current and int(match.group(1)) < cutoff_ns:
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+    # --- Scaler ---
+
+    @staticmethod
+    def _save_scaler(scaler, path):
+        attrs = {name: getattr(scaler, name) for name in SCALER_ATTRIBUTES}
+        feature_names = getattr(scaler, "feature_names_in_", None)
+        if feature_names is not None:
+            attrs["feature_names_in_"] = np.asarray(feature_names, dtype=str)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                feature_range=np.asarray(scaler.feature_range, dtype=np.float64),
+                n_samples_seen_=np.asarray(scaler.n_samples_seen_),
+                **attrs,
+            )
+
+    @staticmethod
+    def _load_scaler(path):
+        with np.load(path, allow_pickle=False) as data:
+            scaler = MinMaxScaler(feature_range=tuple(data["feature_range"].tolist()))
+            for name in SCALER_ATTRIBUTES:
+                setattr(scaler, name, data[name])
+            scaler.n_samples_seen_ = int(data["n_samples_seen_"])
+            scaler.n_features_in_ = len(data["data_min_"])
+            if "feature_names_in_" in data.files:
+                scaler.feature_names_in_ = data["feature_names_in_"].astype(object)
+        return scaler
+
+    # --- Odczyt / zapis ---
+
+    @staticmethod
+    def load(symbol, interval, config):
+        """
+        Zwraca wpis {"meta", "scaler", "weights_path"} dla klucza lub None.
+        Zgodność odcisku danych sprawdza wywołujący. Model globalny (normalizacja
+        per seria) nie ma scalera - wtedy "scaler" to None.
+        """
+        key_dir = ModelRegistry._key_dir(symbol, interval, config)
+        current_path = key_dir / ModelRegistry.CURRENT_FILE
+        if not current_path.exists():
+            return None
+
+        try:
+            version_dir = key_dir / current_path.read_text(encoding="utf-8").strip()
+            meta = json.loads((version_dir / ModelRegistry.META_FILE).read_text(encoding="utf-8"))
+            scaler_path = version_dir / ModelRegistry.SCALER_FILE
+            scaler = ModelRegistry._load_scaler(scaler_path) if scaler_path.exists() else None
+        except Exception as e:
+            print(f"[ModelRegistry] Error loading {key_dir.name}: {e}")
+            return None
+
+        return {
+            "meta": meta,
+            "scaler": scaler,
+            "weights_path": version_dir / ModelRegistry.WEIGHTS_FILE,
+        }
+
+    @staticmethod
+    def save(symbol, interval, config, model, scaler, meta):
+        """Zapisuje wagi, scaler i meta w nowym katalogu wersji i wskazuje go w pliku `current`."""
+        key_dir = ModelRegistry._key_dir(symbol, interval, config)
+        meta = dict(meta, symbol=symbol.upper(), interval=interval, config=config,
+                    updated_at=datetime.now().isoformat(timespec="seconds"))
+
+        # Nazwy wersji rosną w czasie; pid rozróżnia równoległe procesy TrainingPool
+        version = f"v{time.time_ns()}-{os.getpid()}"
+        version_dir = key_dir / version
+        try:
+            version_dir.mkdir(parents=True)
+            model.save_weights(version_dir / ModelRegistry.WEIGHTS_FILE)
+            if scaler is not None:
+                ModelRegistry._save_scaler(scaler, version_dir / ModelRegistry.SCALER_FILE)
+            (version_dir / ModelRegistry.META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+
+            tmp_current = key_dir / f"{ModelRegistry.CURRENT_FILE}.{os.getpid()}.tmp"
+            tmp_current.write_text(version, encoding="utf-8")
+            os.replace(tmp_current, key_dir / ModelRegistry.CURRENT_FILE)
+        except Exception as e:
+            print(f"[ModelRegistry] Error saving {key_dir.name}: {e}")
+            shutil.rmtree(version_dir, ignore_errors=True)
+            return False
+
+        ModelRegistry._prune(key_dir, version)
+        return True
+
+    @staticmethod
+    def clear(symbol=None):
+        if not ModelRegistry.REGISTRY_PATH.exists():
+            return
+        pattern = f"{re.sub(r'[^A-Za-z0-9._-]', '_', symbol.upper())}__*" if symbol else "*"
+        for key_dir in ModelRegistry.REGISTRY_PATH.glob(pattern):
+            shutil.rmtree(key_dir, ignore_errors=True)
@@ -0,0 +1,584 @@
+import os
+import time
+
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.metrics import mean_squared_error, mean_absolute_percentage_error
+os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+import tensorflow as tf
+tf.get_logger().setLevel("ERROR")
+from tensorflow.keras.models import Sequential
+from tensorflow.keras.layers import LSTM, Dense
+from tensorflow.keras.callbacks import Callback
+
+from App.Data.Bars import index_to_utc_ns
+from App.Models.EngineCatalog import PredictionCancelled, TIME_BUDGET as DEFAULT_TIME_BUDGET
+from App.Models.Engines import regression_metrics
+from App.Models.ModelRegistry import ModelRegistry
+from App.Models.Windowing import make_sequence_windows
+
+
+class TrainingBudget(Callback):
+    """
+    Wczesne zatrzymanie, limit czasu i anulowanie treningu w jednym callbacku.
+
+    Przerywa po `patience` epokach bez poprawy `monitor`, po przekroczeniu
+    `time_budget` sekund albo po ustawieniu `cancel_event` (oba sprawdzane
+    po każdym batchu). Na końcu przywraca najlepsze dotąd wagi.
+    """
+
+    def __init__(self, time_budget=None, patience=None, monitor="val_loss", cancel_event=None):
+        super().__init__()
+        self.time_budget = time_budget
+        self.patience = patience
+        self.monitor = monitor
+        self.cancel_event = cancel_event
+
+    def on_train_begin(self, logs=None):
+        self.started = time.perf_counter()
+        self.best = np.inf
+        self.best_weights = None
+        self.wait = 0
+        self.epochs_run = 0
+        self.stop_reason = "epochs"
+
+    def _over_budget(self):
+        return self.time_budget is not None and time.perf_counter() - self.started > self.time_budget
+
+    def on_train_batch_end(self, batch, logs=None):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.model.stop_training = True
+            self.stop_reason = "cancelled"
+        elif self._over_budget():
+            self.model.stop_training = True
+            self.stop_reason = "time_budget"
+
+    def on_epoch_end(self, epoch, logs=None):
+        logs = logs or {}
+        self.epochs_run = epoch + 1
+        current = logs.get(self.monitor, logs.get("loss"))
+
+        if current is not None and current < self.best:
+            self.best = current
+            self.best_weights = self.model.get_weights()
+            self.wait = 0
+        else:
+            self.wait += 1
+            if self.patience is not None and self.wait >= self.patience:
+                self.model.stop_training = True
+                self.stop_reason = "early_stopping"
+
+        if self._over_budget() and self.stop_reason != "cancelled":
+            self.model.stop_training = True
+            self.stop_reason = "time_budget"
+
+    def on_train_end(self, logs=None):
+        if self.best_weights is not None:
+            self.model.set_weights(self.best_weights)
+
+
+def build_inference(model):
+    """
+    Skompilowana raz funkcja predykcji, używana zamiast model.predict
+    (który przy każdym wywołaniu buduje adapter danych i pętlę predykcji).
+
+    infer(windows, last_windows, steps) liczy w jednym przebiegu sieci prognozy
+    o krok naprzód dla `windows` i pierwszy krok dla `last_windows`, a dalej
+    rekurencyjnie ścieżkę `steps` świec: każdy krok dokleja prognozę do okna
+    i odrzuca najstarszą wartość. Okna mają kształt (batch, seq_len, 1);
+    wynik to (len(windows),) i (len(last_windows), steps), w skali modelu.
+    Sygnatura bez rozmiarów batcha i okna - jeden graf na cały model.
+    """
+
+    @tf.function(input_signature=[
+        tf.TensorSpec([None, None, 1], tf.float32),
+        tf.TensorSpec([None, None, 1], tf.float32),
+        tf.TensorSpec([], tf.int32),
+    ])
+    def infer(windows, last_windows, steps):
+        split = tf.shape(windows)[0]
+        predicted = model(tf.concat([windows, last_windows], axis=0), training=False)
+        next_value = predicted[split:]
+
+        outputs = tf.TensorArray(tf.float32, size=steps, element_shape=[None])
+        window = last_windows
+        for step in tf.range(steps):
+            outputs = outputs.write(step, next_value[:, 0])
+            window = tf.concat([window[:, 1:, :], next_value[:, tf.newaxis, :]], axis=1)
+            if step + 1 < steps:
+                next_value = model(window, training=False)
+        # Pustej listy o nieznanym rozmiarze batcha nie da się złożyć - steps=0 to pusta ścieżka
+        paths = tf.cond(
+            steps > 0,
+            lambda: tf.transpose(outputs.stack()),
+            lambda: tf.zeros([tf.shape(last_windows)[0], 0]),
+        )
+        return predicted[:split, 0], paths
+
+    return infer
+
+
+class StockPricePredictor:
+
+    # Douczanie poprzedniego modelu zamiast treningu od zera
+    FINE_TUNE_EPOCHS = 3
+    FINE_TUNE_WINDOWS = 256
+    # Powyżej tego udziału nowych świec dane za bardzo się zmieniły - pełny trening
+    MAX_NEW_BARS_RATIO = 0.2
+    # Dopuszczalne przesunięcie min/max zamknięć względem zapisanego scalera (ułamek jego zakresu)
+    SCALER_DRIFT_TOLERANCE = 0.1
+    # Po tylu kolejnych douczeniach model jest uczony od nowa
+    MAX_FINE_TUNES = 10
+    # Limit czasu jednego treningu [s]; po nim zostają najlepsze dotąd wagi
+    TIME_BUDGET = DEFAULT_TIME_BUDGET
+    # Mniej okien walidacyjnych nie daje sensownego val_loss - wtedy monitorowany jest loss
+    MIN_VALIDATION_WINDOWS = 5
+
+    def __init__(self, config=None, time_budget=TIME_BUDGET, cancel_event=None):
+        self.config = {
+        "units": 64,
+        "epochs": 20,
+        "batch_size": 32,
+        "train_split": 0.8,
+        "min_seq_len": 30,
+        "patience": 4,
+        "validation_split": 0.1,
+        }
+        if config:
+            self.config.update(config)
+
+        self.scaler = MinMaxScaler()
+        self.model = None
+        self._infer = None
+        self.accuracy_metrics = {}
+        self.fine_tunes = 0
+        # Świece dopisane od ostatniego treningu (ustawiane przez load_for_fine_tune)
+        self.new_bars = 0
+        self.time_budget = time_budget
+        # threading.Event albo Event z multiprocessing.Manager (trening w TrainingPool)
+        self.cancel_event = cancel_event
+        self.training_stats = {"epochs_run": 0, "train_time": 0.0, "stop_reason": None}
+
+    def sequence_length(self, n_points):
+        return min(self.config["min_seq_len"], n_points // 3)
+
+    def prepare_data(self, df, refit=True):
+        if refit:
+            scaled = self.scaler.fit_transform(df[["Close"]])
+        else:
+            # Douczanie: skala musi zostać taka, na jakiej model był uczony
+            scaled = self.scaler.transform(df[["Close"]])
+        seq_len = self.sequence_length(len(scaled))
+
+        X, y = make_sequence_windows(scaled, seq_len)
+        train_size = int(len(X) * self.config["train_split"])
+
+        return X[:train_size], y[:train_size], X[train_size:], y[train_size:], seq_len, scaled
+
+    def build_model(self, seq_len):
+        self.model = Sequential([
+            LSTM(self.config["units"], return_sequences=False, input_shape=(seq_len, 1)),
+            Dense(1)
+        ])
+        self.model.compile(optimizer="adam", loss="mse")
+        self._infer = build_inference(self.model)
+        self.fine_tunes = 0
+
+    def _fit(self, X_train, y_train, epochs, validate=True):
+        validation_split = self.config["validation_split"] if validate else 0.0
+        if len(X_train) * validation_split < self.MIN_VALIDATION_WINDOWS:
+            validation_split = 0.0
+
+        budget = TrainingBudget(
+            time_budget=self.time_budget,
+            patience=self.config["patience"],
+            monitor="val_loss" if validation_split else "loss",
+            cancel_event=self.cancel_event,
+        )
+        self.model.fit(
+            X_train, y_train,
+            epochs=epochs,
+            batch_size=self.config["batch_size"],
+            # Keras bierze ostatnie okna (najnowsze dane) przed tasowaniem
+            validation_split=validation_split,
+            callbacks=[budget],
+            verbose=0
+        )
+        self.training_stats = {
+            "epochs_run": budget.epochs_run,
+            "train_time": time.perf_counter() - budget.started,
+            "stop_reason": budget.stop_reason,
+        }
+        if budget.stop_reason == "cancelled":
+            raise PredictionCancelled("Training cancelled")
+        return self.training_stats
+
+    def train(self, X_train, y_train):
+        return self._fit(X_train, y_train, self.config["epochs"])
+
+    def fine_tune(self, X, y):
+        """
+        Kilka epok na FINE_TUNE_WINDOWS ostatnich oknach całej serii (nie tylko części
+        uczącej), czyli na oknach kończących się na dopisanych świecach i tych tuż przed
+        nimi. Bez walidacji - validation_split odciąłby właśnie najnowsze okna.
+        """
+        stats = self._fit(
+            X[-self.FINE_TUNE_WINDOWS:], y[-self.FINE_TUNE_WINDOWS:],
+            self.FINE_TUNE_EPOCHS, validate=False,
+        )
+        self.fine_tunes += 1
+        return stats
+
+    def infer(self, windows, last_windows, horizon=1):
+        """Prognozy o krok naprzód dla `windows` i ścieżki `horizon` świec z `last_windows` (skala modelu)."""
+        predicted, paths = self._infer(
+            tf.constant(windows, dtype=tf.float32),
+            tf.constant(last_windows, dtype=tf.float32),
+            tf.constant(horizon, dtype=tf.int32),
+        )
+        return predicted.numpy(), paths.numpy()
+
+    def calculate_accuracy(self, X_test, y_test, predictions=None):
+        if len(X_test) == 0:
+            self.accuracy_metrics = {"accuracy": 0.0, "rmse": 0.0, "mape": 0.0}
+            return self.accuracy_metrics
+
+        if predictions is None:
+            predictions, _ = self.infer(X_test, X_test[:0], 0)
+        predictions = predictions.reshape(-1, 1)
+
+        y_test_actual = self.scaler.inverse_transform(y_test)
+        predictions_actual = self.scaler.inverse_transform(predictions)
+
+
+        rmse = np.sqrt(mean_squared_error(y_test_actual, predictions_actual))
+        mape = mean_absolute_percentage_error(y_test_actual, predictions_actual) * 100
+
+        accuracy = max(0, 100 - mape)
+
+        self.accuracy_metrics = {
+            "accuracy": accuracy,
+            "rmse": rmse,
+            "mape": mape
+        }
+
+        return self.accuracy_metrics
+
+    def _restore(self, entry):
+        try:
+            seq_len = entry["meta"]["seq_len"]
+            self.build_model(seq_len)
+            # Stan optymalizatora jest zapisany razem z wagami - musi istnieć przed wczytaniem
+            self.model.optimizer.build(self.model.trainable_variables)
+            self.model.load_weights(entry["weights_path"])
+        except Exception as e:
+            print(f"[Predictor] Stored model unusable, retraining: {e}")
+            self.model = None
+            return None
+
+        self.scaler = entry["scaler"]
+        self.accuracy_metrics = entry["meta"].get("metrics", {})
+        self.fine_tunes = entry["meta"].get("fine_tunes", 0)
+        self.training_stats = dict(self.training_stats, stop_reason=entry["meta"].get("stop_reason"))
+        return seq_len
+
+    def load_cached_result(self, symbol, interval, fingerprint, horizon):
+        """Wynik zapisany z modelem uczonym na identycznych danych - bez budowy sieci; None, jeśli go brak."""
+        entry = ModelRegistry.load(symbol, interval, self.config)
+        if entry is None:
+            return None
+        meta = entry["meta"]
+        # Ścieżka jest rekurencyjna, więc krótszy horyzont to początek zapisanej
+        forecast = meta.get("forecast", [])[:horizon]
+        metrics = meta.get("metrics", {})
+        if (meta.get("fingerprint") != fingerprint or meta.get("stop_reason") == "time_budget"
+                or len(forecast) < horizon or not metrics):
+            return None
+        return {
+            "next_price": forecast[0],
+            "forecast": forecast,
+            "accuracy": metrics["accuracy"],
+            "rmse": metrics["rmse"],
+            "mape": metrics["mape"],
+            "training_mode": "cached",
+            "fine_tune_time": 0.0,
+            "walk_forward": None,
+            "epochs_run": 0,
+            "train_time": 0.0,
+        }
+
+    def load_trained(self, symbol, interval, fingerprint):
+        """Wczytuje model uczony na identycznych danych; zwraca seq_len albo None."""
+        entry = ModelRegistry.load(symbol, interval, self.config)
+        if entry is None or entry["meta"].get("fingerprint") != fingerprint:
+            return None
+        if entry["meta"].get("stop_reason") == "time_budget":
+            # Trening przerwany limitem czasu - zamiast gotowego wyniku douczamy dalej
+            return None
+        return self._restore(entry)
+
+    def _scaler_drifted(self, df):
+        closes = df["Close"].to_numpy(dtype=np.float64)
+        old_min = float(self.scaler.data_min_[0])
+        old_range = float(self.scaler.data_range_[0]) or 1.0
+        shift_low = abs(closes.min() - old_min) / old_range
+        shift_high = abs(closes.max() - (old_min + old_range)) / old_range
+        return max(shift_low, shift_high) > self.SCALER_DRIFT_TOLERANCE
+
+    def load_for_fine_tune(self, symbol, interval, df):
+        """
+        Wczytuje poprzedni model klucza do douczenia, jeśli od ostatniego treningu
+        doszło tylko kilka świec, długość okna się nie zmieniła, a zakres cen
+        mieści się w skali zapisanego scalera. Zwraca seq_len albo None (pełny trening).
+        """
+        entry = ModelRegistry.load(symbol, interval, self.config)
+        if entry is None:
+            return None
+
+        meta = entry["meta"]
+        last_bar_ns = meta.get("last_bar_ns")
+        if last_bar_ns is None or meta.get("fine_tunes", 0) >= self.MAX_FINE_TUNES:
+            return None
+        if meta.get("seq_len") != self.sequence_length(len(df)):
+            return None
+
+        new_bars = int((index_to_utc_ns(df.index) > last_bar_ns).sum())
+        if new_bars > len(df) * self.MAX_NEW_BARS_RATIO:
+            return None
+        self.new_bars = new_bars
+
+        seq_len = self._restore(entry)
+        if seq_len is not None and self._scaler_drifted(df):
+            self.model = None
+            self.scaler = MinMaxScaler()
+            return None
+        return seq_len
+
+    def save_trained(self, symbol, interval, fingerprint, seq_len, last_bar_ns, forecast):
+        ModelRegistry.save(symbol, interval, self.config, self.model, self.scaler, {
+            "fingerprint": fingerprint,
+            "seq_len": seq_len,
+            "last_bar_ns": last_bar_ns,
+            "fine_tunes": self.fine_tunes,
+            "stop_reason": self.training_stats["stop_reason"],
+            "metrics": {name: float(value) for name, value in self.accuracy_metrics.items()},
+            # Prognoza dla danych z `fingerprint` - kolejne wywołanie zwraca ją bez TensorFlow
+            "forecast": [float(value) for value in forecast],
+        })
+
+    @staticmethod
+    def last_window(scaled_data, seq_len):
+        return np.asarray(scaled_data[-seq_len:], dtype=np.float32).reshape(1, seq_len, 1)
+
+    def predict_path(self, scaled_data, seq_len, horizon=1):
+        last_seq = self.last_window(scaled_data, seq_len)
+        _, paths = self.infer(last_seq[:0], last_seq, horizon)
+        return self.scaler.inverse_transform(paths.reshape(-1, 1))[:, 0]
+
+    def predict_next(self, scaled_data, seq_len):
+        return self.predict_path(scaled_data, seq_len, 1)[0]
+
+    def fit_predict(self, df, symbol=None, interval=None, horizon=1):
+        """
+        Pełny przebieg predykcji: gotowy model z rejestru, douczenie albo trening od zera.
+        Bez symbolu/interwału rejestr jest pomijany (np. w benchmarkach).
+        """
+        use_registry = symbol is not None and interval is not None
+        fingerprint = ModelRegistry.fingerprint(df) if use_registry else None
+        training_mode = "full"
+        seq_len = None
+        if use_registry:
+            cached = self.load_cached_result(symbol, interval, fingerprint, horizon)
+            if cached is not None:
+                return cached
+            training_mode = "cached"
+            seq_len = self.load_trained(symbol, interval, fingerprint)
+            if seq_len is None:
+                seq_len = self.load_for_fine_tune(symbol, interval, df)
+                training_mode = "fine_tune" if seq_len is not None else "full"
+
+        fine_tune_time = 0.0
+        training_stats = {"epochs_run": 0, "train_time": 0.0}
+        walk_forward = None
+        if training_mode == "cached":
+            scaled = self.scaler.transform(df[["Close"]])
+            accuracy_metrics = self.accuracy_metrics
+            forecast = self.predict_path(scaled, seq_len, horizon)
+            # Wpis bez zapisanej prognozy (albo z krótszą) - następnym razem wystarczy meta
+            self.save_trained(
+                symbol, interval, fingerprint, seq_len, int(index_to_utc_ns(df.index)[-1]), forecast
+            )
+        elif training_mode == "fine_tune":
+            scaled = self.scaler.transform(df[["Close"]])
+            X, y = make_sequence_windows(scaled, seq_len)
+            # Metryki zbioru testowego z pełnego treningu zostają w rejestrze; ocena
+            # walk-forward (okna kończące się na nowych świecach, prognozowane modelem
+            # sprzed douczenia) to zwykle kilka okien, więc idzie obok nich
+            accuracy_metrics = self.accuracy_metrics
+            X_test, y_test = X[-max(1, self.new_bars):], y[-max(1, self.new_bars):]
+            predicted, _ = self.infer(X_test, X_test[:0], 0)
+            walk_forward = self.calculate_accuracy(X_test, y_test, predicted)
+            walk_forward["windows"] = len(X_test)
+            self.accuracy_metrics = accuracy_metrics
+
+            fine_tune_time = self.fine_tune(X, y)["train_time"]
+            training_stats = self.training_stats
+            forecast = self.predict_path(scaled, seq_len, horizon)
+            self.save_trained(
+                symbol, interval, fingerprint, seq_len, int(index_to_utc_ns(df.index)[-1]), forecast
+            )
+        else:
+            X_train, y_train, X_test, y_test, seq_len, scaled = self.prepare_data(df)
+            self.build_model(seq_len)
+            self.train(X_train, y_train)
+
+            training_stats = self.training_stats
+            # Okna testowe i ostatnie okno w jednym wywołaniu sieci
+            predicted, paths = self.infer(X_test, self.last_window(scaled, seq_len), horizon)
+            accuracy_metrics = self.calculate_accuracy(X_test, y_test, predicted)
+            forecast = self.scaler.inverse_transform(paths.reshape(-1, 1))[:, 0]
+            if use_registry:
+                self.save_trained(
+                    symbol, interval, fingerprint, seq_len, int(index_to_utc_ns(df.index)[-1]), forecast
+                )
+
+        return {
+            "next_price": float(forecast[0]),
+            "forecast": [float(value) for value in forecast],
+            "accuracy": accuracy_metrics["accuracy"],
+            "rmse": accuracy_metrics["rmse"],
+            "mape": accuracy_metrics["mape"],
+            "training_mode": training_mode,
+            "fine_tune_time": fine_tune_time,
+            "walk_forward": walk_forward,
+            "epochs_run": training_stats["epochs_run"],
+            "train_time": training_stats["train_time"],
+        }
+
+
+class GlobalPredictor(StockPricePredictor):
+    """
+    Jeden model LSTM uczony na oknach ze wszystkich ulubionych tickerów.
+
+    Każda seria jest normalizowana osobno (min-max po własnych zamknięciach), więc
+    model uczy się kształtu ruchu, a nie poziomu ceny i może prognozować dowolny
+    symbol. Prognozy dla całej listy to jeden trening i jedno wywołanie predict
+    na wspólnym batchu (okna testowe + ostatnie okno każdej serii). Wyniki per
+    symbol trafiają do meta rejestru i są zwracane bez TensorFlow, dopóki dane
+    serii się nie zmienią.
+    """
+
+    REGISTRY_SYMBOL = "_GLOBAL"
+
+    @staticmethod
+    def _normalize(closes):
+        low, high = closes.min(), closes.max()
+        span = (high - low) or 1.0
+        return (closes - low) / span, low, span
+
+    def _needs_training(self, entry, train_frames, seq_len):
+        if entry is None:
+            return True
+        meta = entry["meta"]
+        if sorted(meta.get("symbols", [])) != sorted(train_frames) or meta.get("seq_len") != seq_len:
+            return True
+        if meta.get("stop_reason") == "time_budget":
+            return True
+
+        trained_until = meta.get("last_bar_ns", {})
+        for symbol, df in train_frames.items():
+            new_bars = int((index_to_utc_ns(df.index) > trained_until.get(symbol, 0)).sum())
+            if new_bars > len(df) * self.MAX_NEW_BARS_RATIO:
+                return True
+        return False
+
+    def fit_predict_many(self, frames, interval, train_symbols=None, horizon=1):
+        """
+        Zwraca {symbol: wynik jak z fit_predict} dla wszystkich serii z `frames`.
+        Model uczy się tylko na `train_symbols` (domyślnie wszystkie serie).
+        """
+        train_symbols = [s for s in (train_symbols or frames) if s in frames]
+        fingerprints = {symbol: ModelRegistry.fingerprint(df) for symbol, df in frames.items()}
+
+        seq_len = self.sequence_length(min(len(df) for df in frames.values()))
+        entry = ModelRegistry.load(self.REGISTRY_SYMBOL, interval, self.config)
+        cached = entry["meta"].get("results", {}) if entry else {}
+        # Wyniki są ważne tylko dla modelu uczonego na tej samej liście serii i tym samym oknie
+        if (entry and sorted(entry["meta"].get("symbols", [])) == sorted(train_symbols)
+                and entry["meta"].get("seq_len") == seq_len
+                and all(
+                    cached.get(s, {}).get("fingerprint") == fingerprints[s]
+                    and len(cached[s]["result"].get("forecast", [])) >= horizon
+                    for s in frames
+                )):
+            return {s: self._trim_horizon(dict(cached[s]["result"], training_mode="cached"), horizon) for s in frames}
+
+        series = {s: self._normalize(df["Close"].to_numpy(dtype=np.float64)) for s, df in frames.items()}
+        windows = {s: make_sequence_windows(scaled[:, np.newaxis], seq_len) for s, (scaled, _, _) in series.items()}
+        splits = {s: int(len(X) * self.config["train_split"]) for s, (X, _) in windows.items()}
+
+        train_frames = {s: frames[s] for s in train_symbols}
+        training_mode = "global"
+        meta = dict(entry["meta"]) if entry else {}
+        if self._needs_training(entry, train_frames, seq_len) or self._restore(entry) is None:
+            self.build_model(seq_len)
+            self.train(
+                np.concatenate([windows[s][0][:splits[s]] for s in train_symbols]),
+                np.concatenate([windows[s][1][:splits[s]] for s in train_symbols]),
+            )
+            training_mode = "full"
+            meta = {
+                "symbols": train_symbols,
+                "last_bar_ns": {s: int(index_to_utc_ns(frames[s].index)[-1]) for s in train_symbols},
+                "stop_reason": self.training_stats["stop_reason"],
+            }
+
+        # Jedno wywołanie sieci na okna testowe i ostatnie okna wszystkich serii,
+        # dalej wspólna rekurencyjna prognoza `horizon` świec
+        symbols = list(frames)
+        test_batch = np.concatenate([windows[s][0][splits[s]:] for s in symbols])
+        last_windows = np.stack([series[s][0][-seq_len:] for s in symbols])[:, :, np.newaxis]
+        predicted, paths = self.infer(test_batch, last_windows, horizon)
+
+        results, offset = {}, 0
+        for symbol in symbols:
+            _, low, span = series[symbol]
+            y_test = windows[symbol][1][splits[symbol]:, 0]
+            test_predicted = predicted[offset:offset + len(y_test)]
+            offset += len(y_test)
+            results[symbol] = {
+                **regression_metrics(y_test * span + low, test_predicted * span + low),
+                "training_mode": training_mode,
+                "fine_tune_time": 0.0,
+                "epochs_run": self.training_stats["epochs_run"] if training_mode == "full" else 0,
+                "train_time": self.training_stats["train_time"] if training_mode == "full" else 0.0,
+            }
+        for symbol, path in zip(symbols, paths):
+            _, low, span = series[symbol]
+            forecast = [float(value * span + low) for value in path]
+            results[symbol]["next_price"] = forecast[0]
+            results[symbol]["forecast"] = forecast
+
+        cached.update({s: {"fingerprint": fingerprints[s], "result": results[s]} for s in symbols})
+        ModelRegistry.save(self.REGISTRY_SYMBOL, interval, self.config, self.model, None,
+                           dict(meta, seq_len=seq_len, results=cached))
+        return results
+
+    @staticmethod
+    def _trim_horizon(result, horizon):
+        result["forecast"] = result["forecast"][:horizon]
+        return result
+
+    def fit_predict(self, df, symbol=None, interval=None, horizon=1, favorites=None):
+        """
+        Prognoza jednego symbolu modelem globalnym uczonym na `favorites` ({symbol: df}).
+
+        `favorites` to cała lista ulubionych, także gdy zawiera `symbol` - zbiór treningowy
+        jest ten sam dla każdego z nich, więc przełączanie celu korzysta z jednego modelu.
+        Symbol spoza listy jest tylko prognozowany.
+        """
+        symbol = symbol or "_SERIES"
+        frames = dict(favorites or {})
+        train_symbols = list(frames) or [symbol]
+        frames[symbol] = df
+        return self.fit_predict_many(frames, interval or "", train_symbols, horizon)[symbol]
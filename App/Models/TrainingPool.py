@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from App.Models.EngineCatalog import PredictionCancelled, load_engine
+from Launcher.StartupProfiler import StartupProfiler
+
+
+def _init_process(threads, started):
+    # Kilka procesów z pełną pulą wątków TF naraz tylko by się wywłaszczało.
+    # Przez zmienne środowiskowe, bo TensorFlow ładuje się dopiero z silnikiem LSTM.
+    os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
+    os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+    os.environ["TF_NUM_INTRAOP_THREADS"] = str(threads)
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    # Pid zgłaszany rodzicowi - shutdown kończy dokładnie procesy tej puli
+    started.put(os.getpid())
+
+
+def _warm_up():
+    # Import TensorFlow i Keras w procesie puli, zanim przyjdzie pierwsza predykcja
+    load_engine("LSTM")
+    return os.getpid()
+
+
+def _run_prediction(engine, payload, symbol, interval, time_budget, cancel_event, favorites=None, horizon=1):
+    # Wykonywane w procesie puli - tu ładuje się TensorFlow, nie w GUI
+    from App.Data.Bars import arrays_to_bars
+
+    if cancel_event is not None and cancel_event.is_set():
+        raise PredictionCancelled("Cancelled before start")
+
+    df = arrays_to_bars(payload)
+    predictor = load_engine(engine)(time_budget=time_budget, cancel_event=cancel_event)
+    if favorites is not None:
+        # Model globalny - pozostałe serie do wspólnego treningu
+        favorites = {ticker: arrays_to_bars(bars) for ticker, bars in favorites.items()}
+        return predictor.fit_predict(df, symbol, interval, horizon=horizon, favorites=favorites)
+    return predictor.fit_predict(df, symbol, interval, horizon=horizon)
+
+
+class TrainingPool:
+    """
+    Pula procesów (spawn) do treningu i predykcji silników TensorFlow.
+
+    Keras w wątku GUI dzieli z interfejsem GIL i środowisko TensorFlow, przez co okno
+    przycina się podczas model.fit. Tutaj każda predykcja idzie do osobnego procesu:
+    świece jako tablice NumPy, z powrotem słownik wyniku fit_predict (Future).
+    Kilka predykcji może liczyć się równolegle na kilku rdzeniach.
+
+    Trwający trening przerywa Event z new_cancel_event() (Manager - działa między
+    procesami); zadanie czekające w kolejce wystarczy anulować przez Future.cancel().
+    """
+
+    MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = None
+        self._manager = None
+        # Pidy zgłaszane przez initializer procesów bieżącej puli
+        self._started = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+                self._started = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_process,
+                    initargs=(threads, self._started),
+                )
+            return self._executor
+
+    def new_cancel_event(self):
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.get_context("spawn").Manager()
+            return self._manager.Event()
+
+    def warm_up(self, processes=1):
+        """
+        W tle uruchamia `processes` procesów z załadowanym TensorFlow oraz Manager
+        zdarzeń anulowania. Wołane przy pierwszym wejściu na stronę predykcji, żeby
+        pierwsza predykcja nie czekała na start procesu i import TF.
+        """
+        def run():
+            try:
+                executor = self._get_executor()
+                for _ in range(min(processes, self.max_workers)):
+                    executor.submit(_warm_up).add_done_callback(
+                        lambda _: StartupProfiler.mark("TrainingPool warm (TensorFlow loaded)", once=True)
+                    )
+                self.new_cancel_event()
+            except Exception as e:
+                print(f"[TrainingPool] Warm-up failed: {e}")
+
+        threading.Thread(target=run, name="TrainingPoolWarmUp", daemon=True).start()
+
+    def _reset(self, broken):
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+
+    def submit(self, engine, df, symbol, interval, time_budget=None, cancel_event=None, favorites=None, horizon=1):
+        from App.Data.Bars import bars_to_arrays
+
+        if favorites is not None:
+            favorites = {ticker: bars_to_arrays(bars) for ticker, bars in favorites.items()}
+        args = (engine, bars_to_arrays(df), symbol, interval, time_budget, cancel_event, favorites, horizon)
+        executor = self._get_executor()
+        try:
+            return executor.submit(_run_prediction, *args)
+        except BrokenProcessPool:
+            # Proces puli padł (np. brak pamięci) - nowa pula i jedna ponowna próba
+            print("[TrainingPool] Process pool broken, restarting")
+            self._reset(executor)
+            return self._get_executor().submit(_run_prediction, *args)
+
+    def shutdown(self):
+        """Przy zamykaniu aplikacji: porzuca kolejkę i kończy procesy, żeby nie czekać na trwający trening."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            manager, self._manager = self._manager, None
+            started, self._started = self._started, None
+        if manager is not None:
+            manager.shutdown()
+        if executor is None:
+            return
+        pids = []
+        while not started.empty():
+            pids.append(started.get())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for pid in pids:
+            try:
+                # Na Windows os.kill z SIGTERM to TerminateProcess
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                # Proces już się zakończył
+                pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_training_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = TrainingPool()
+        return _pool
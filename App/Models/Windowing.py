@@ -0,0 +1,19 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def make_sequence_windows(scaled, seq_len):
+    """
+    Okna uczące dla LSTM bez pętli i bez kopiowania.
+
+    `scaled` ma kształt (n, 1). Zwraca X o kształcie (n - seq_len, seq_len, 1)
+    jako widok tylko do odczytu na `scaled` oraz y = scaled[seq_len:]
+    (wartość następna po każdym oknie).
+    """
+    n = len(scaled)
+    if n <= seq_len or seq_len <= 0:
+        return np.empty((0, max(seq_len, 0), 1), dtype=scaled.dtype), scaled[:0]
+
+    X = sliding_window_view(scaled[:-1, 0], seq_len)[:, :, np.newaxis]
+    y = scaled[seq_len:]
+    return X, y
@@ -1,12 +1,11 @@
 import os
 from datetime import datetime
 from pathlib import Path
-import yfinance as yf
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QInputDialog, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt, QThread, Signal, QUrl, QTimer
+from PySide6.QtCore import Qt, QObject, Signal, QUrl
 from PySide6.QtGui import QDesktopServices, QPixmap
 
 from App.App_state import AppState
@@ -15,7 +14,25 @@ from App.App_state import AppState
     # scroll_area, action_button itp.
 from App.translations import TRANSLATIONS
 from App.Pages.HomeThemes import LIGHT_THEME, DARK_THEME
+from App.Data.Quotes import MarketQuotes
+from App.Data.NameCache import NameCache
+from App.Data.Providers import get_provider
+from App.Data.FetchEngine import get_fetch_engine
+from App.Data.MarketHours import MarketHoursScheduler
 from Launcher.ConfigManager import ConfigManager
+from Launcher.StartupProfiler import StartupProfiler
+
+
+MARKET_INDICES = [
+    ("^GSPC", "S&P 500"),
+    ("^DJI", "Dow Jones"),
+    ("^IXIC", "NASDAQ"),
+    ("^FTSE", "FTSE 100"),
+    ("^GDAXI", "DAX"),
+    ("^FCHI", "CAC 40"),
+    ("^N225", "Nikkei 225"),
+    ("000001.SS", "Shanghai"),
+]
 
 
 # --- Helpery ---
@@ -69,59 +86,92 @@ class HomeConfigExtension:
             return False
 
 
+def warm_home_data(provider=None, engine=None):
+    """Notowania i nazwy dla paneli strony głównej, pobierane zanim powstanie okno główne"""
+    provider = provider or get_provider()
+    engine = engine or get_fetch_engine()
+    # Bez pliku ulubionych (pierwsze uruchomienie) tylko indeksy - load_favorites zapisałby domyślne
+    favorites = []
+    if HomeConfigExtension._get_favorites_path().exists():
+        favorites = HomeConfigExtension.load_favorites()
+    symbols = list(dict.fromkeys(favorites + [ticker for ticker, _ in MARKET_INDICES]))
+    return engine.gather([
+        (MarketQuotes.prefetch_quotes, (symbols,), {"provider": provider}),
+        (NameCache.get_names, (favorites,), {}),
+    ], host=provider.host)
+
+
 # --- Worker ---
 
-class MarketWorker(QThread):
+class MarketWorker(QObject):
+    """Notowania i nazwy spółek przez FetchEngine; interfejs jak QThread"""
     finished = Signal(dict)
 
-    def __init__(self, tickers, parent=None):
+    def __init__(self, tickers, parent=None, with_names=True, provider=None, engine=None):
         super().__init__(parent)
         self.tickers = tickers
+        self.with_names = with_names
+        self.provider = provider or get_provider()
+        self.engine = engine or get_fetch_engine()
+        self._future = None
 
-    def run(self):
+    def start(self):
         if not self.tickers:
             self.finished.emit({})
             return
+
+        calls = [(MarketQuotes.fetch_quotes, (list(self.tickers),), {"provider": self.provider})]
+        if self.with_names:
+            calls.append((NameCache.get_names, (list(self.tickers),), {}))
+
+        self._future = self.engine.gather(calls, host=self.provider.host)
+        self._future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        # Wywoływane w wątku silnika - sygnał trafi do wątku GUI jako queued
+        if future.cancelled():
+            return
         try:
+            data = self._collect(future.result())
+        except Exception as e:
+            print(f"Market data error: {e}")
             data = {}
-            for ticker in self.tickers:
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-                    hist = stock.history(period="2d")
-
-                    company_name = info.get('longName', info.get('shortName', ticker))
-
-                    if not hist.empty and len(hist) >= 2:
-                        current = hist['Close'].iloc[-1]
-                        prev = hist['Close'].iloc[-2]
-                        change_pct = ((current - prev) / prev) * 100
-                        data[ticker] = {
-                            "price": float(current),
-                            "change": float(change_pct),
-                            "name": company_name
-                        }
-                    elif not hist.empty:
-                        current = hist['Close'].iloc[-1]
-                        data[ticker] = {
-                            "price": float(current),
-                            "change": 0.0,
-                            "name": company_name
-                        }
-                    else:
-                        data[ticker] = {
-                            "price": 0.0,
-                            "change": 0.0,
-                            "name": company_name
-                        }
-                except Exception as e:
-                    print(f"Error fetching {ticker}: {e}")
-                    data[ticker] = {"price": 0.0, "change": 0.0, "name": ticker}
+        else:
+            # Koniec startu z punktu widzenia użytkownika - pierwsze notowania na ekranie
+            if StartupProfiler.mark("first MarketWorker result", once=True):
+                StartupProfiler.write_report("first MarketWorker result")
 
+        try:
             self.finished.emit(data)
-        except Exception as e:
-            print(f"Market data error: {e}")
-            self.finished.emit({})
+        except RuntimeError:
+            # Panel został zamknięty zanim przyszły dane
+            pass
+
+    def _collect(self, results):
+        names = results.pop() if self.with_names else {}
+
+        data = results[0]
+        if isinstance(data, Exception):
+            print(f"Error fetching quotes: {data}")
+            data = {ticker: {"price": 0.0, "change": 0.0} for ticker in self.tickers}
+
+        if isinstance(names, Exception):
+            print(f"Market names error: {names}")
+            names = {}
+        if self.with_names:
+            for ticker, values in data.items():
+                values["name"] = names.get(ticker, ticker)
+        return data
+
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
+
+    def quit(self):
+        if self._future is not None:
+            self._future.cancel()
+
+    def wait(self):
+        pass
 
 
 # --- Widgety ---
@@ -320,22 +370,17 @@ class FavoritesPanel(CardFrame):
 
 
 class MarketIndicesPanel(CardFrame):
+    REFRESH_INTERVAL_MS = 2000
+
     def __init__(self):
         super().__init__()
 
-        self.tickers = [
-            ("^GSPC", "S&P 500"),
-            ("^DJI", "Dow Jones"),
-            ("^IXIC", "NASDAQ"),
-            ("^FTSE", "FTSE 100"),
-            ("^GDAXI", "DAX"),
-            ("^FCHI", "CAC 40"),
-            ("^N225", "Nikkei 225"),
-            ("000001.SS", "Shanghai"),
-        ]
+        self.tickers = list(MARKET_INDICES)
 
         self.items = {}
         self.worker = None
+        # Symbole zlecone w trakcie pobierania - m.in. jednorazowe "właśnie zamknięte"
+        self._pending = set()
 
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -366,23 +411,30 @@ class MarketIndicesPanel(CardFrame):
         self.update_ui()
         self.refresh_data()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_data)
-        self.timer.start(2000)
+        self.scheduler = MarketHoursScheduler(
+            [t[0] for t in self.tickers], self.REFRESH_INTERVAL_MS, parent=self
+        )
+        self.scheduler.refresh_requested.connect(self.refresh_data)
+        self.scheduler.start()
 
-    def refresh_data(self):
-        ticker_symbols = [t[0] for t in self.tickers]
+    def refresh_data(self, symbols=None):
+        ticker_symbols = symbols or [t[0] for t in self.tickers]
 
         if self.worker is not None and self.worker.isRunning():
+            self._pending.update(ticker_symbols)
             return
 
-        self.worker = MarketWorker(ticker_symbols, parent=self)
+        self.worker = MarketWorker(ticker_symbols, parent=self, with_names=False)
         self.worker.finished.connect(self.on_data_received)
         self.worker.finished.connect(self._clear_worker)
         self.worker.start()
 
     def _clear_worker(self, _data=None):
         self.worker = None
+        if self._pending:
+            symbols = [t[0] for t in self.tickers if t[0] in self._pending]
+            self._pending.clear()
+            self.refresh_data(symbols)
 
     def on_data_received(self, data):
         for ticker, values in data.items():
@@ -399,8 +451,8 @@ class MarketIndicesPanel(CardFrame):
             scroll.setStyleSheet(theme["scroll_area"])
 
     def closeEvent(self, event):
-        if hasattr(self, "timer"):
-            self.timer.stop()
+        if hasattr(self, "scheduler"):
+            self.scheduler.stop()
 
         if self.worker is not None and self.worker.isRunning():
             self.worker.quit()
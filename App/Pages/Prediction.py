@@ -1,24 +1,18 @@
-import yfinance as yf
-import pandas as pd
-import numpy as np
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import mplfinance as mpf
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_percentage_error
-import os
-os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout, QMessageBox, QSizePolicy
 )
-from PySide6.QtCore import QThread, Signal, Qt
+from PySide6.QtCore import QObject, QTimer, Signal, Qt
 
 from App.theme_system import ( ThemeManager, AutoRefreshWidget, SmartLabel,
                                SmartButton, SmartLineEdit, SmartComboBox, LayoutHelper)
-
+from App.Data.FetchEngine import get_fetch_engine
+from App.Data.NameCache import NameCache
+from App.Data.Providers import get_provider
+from App.Data.Prefetch import Prefetcher
+from App.Models.EngineCatalog import (PREDICTION_ENGINES, DEFAULT_ENGINE, TIME_BUDGET,
+                                      load_engine, uses_favorites, uses_pool)
+from App.Models.TrainingPool import get_training_pool
+from App.Pages.HomePage import HomeConfigExtension
 
 
 PREDICTION_RANGES = {
@@ -30,110 +24,47 @@ PREDICTION_RANGES = {
     "30d": {"period": "5y", "interval": "1mo", "dt_format": "%Y-%m-%d", "tail": 80},
 }
 
+# Liczba prognozowanych świec naprzód
+FORECAST_HORIZONS = [1, 3, 5, 10]
 
-class StockPricePredictor:
-
-    def __init__(self, config=None):
-        self.config = {
-        "units": 64,
-        "epochs": 20,
-        "batch_size": 32,
-        "train_split": 0.8,
-        "min_seq_len": 30,
-        }
-
-
-        self.scaler = MinMaxScaler()
-        self.model = None
-        self.accuracy_metrics = {}
-
-    def prepare_data(self, df):
-        scaled = self.scaler.fit_transform(df[["Close"]])
-        seq_len = min(self.config["min_seq_len"], len(scaled) // 3)
-
-        X, y = [], []
-        for i in range(len(scaled) - seq_len):
-            X.append(scaled[i:i + seq_len])
-            y.append(scaled[i + seq_len])
-
-        X, y = np.array(X), np.array(y)
-        train_size = int(len(X) * self.config["train_split"])
-
-        return X[:train_size], y[:train_size], X[train_size:], y[train_size:], seq_len, scaled
-
-    def build_model(self, seq_len):
-        self.model = Sequential([
-            LSTM(self.config["units"], return_sequences=False, input_shape=(seq_len, 1)),
-            Dense(1)
-        ])
-        self.model.compile(optimizer="adam", loss="mse")
-
-    def train(self, X_train, y_train):
-        self.model.fit(
-            X_train, y_train,
-            epochs=self.config["epochs"],
-            batch_size=self.config["batch_size"],
-            verbose=0
-        )
-
-    def calculate_accuracy(self, X_test, y_test):
-        if len(X_test) == 0:
-            return {"accuracy": 0.0, "rmse": 0.0, "mape": 0.0}
-
-        predictions = self.model.predict(X_test, verbose=0)
-
-        y_test_actual = self.scaler.inverse_transform(y_test)
-        predictions_actual = self.scaler.inverse_transform(predictions)
-
-
-        rmse = np.sqrt(mean_squared_error(y_test_actual, predictions_actual))
-        mape = mean_absolute_percentage_error(y_test_actual, predictions_actual) * 100
-
-        accuracy = max(0, 100 - mape)
-
-        self.accuracy_metrics = {
-            "accuracy": accuracy,
-            "rmse": rmse,
-            "mape": mape
-        }
-
-        return self.accuracy_metrics
-
-    def predict_next(self, scaled_data, seq_len):
-        last_seq = scaled_data[-seq_len:].reshape(1, seq_len, 1)
-        pred_scaled = self.model.predict(last_seq, verbose=0)
-        return self.scaler.inverse_transform(pred_scaled)[0][0]
 
 
 
-class PredictionWorker(QThread):
-    finished = Signal(dict)
-    error = Signal(str)
-    progress = Signal(str)
+class PredictionWorker(QObject):
+    """Pobieranie przez FetchEngine, trening w TrainingPool; interfejs jak QThread"""
+    finished = Signal(int, dict)
+    error = Signal(int, str)
+    progress = Signal(int, str)
 
-    REQUIRED_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
     MIN_DATA_POINTS = 30
 
-    def __init__(self, symbol, period, interval):
+    def __init__(self, symbol, period, interval, provider=None,
+                 time_budget=TIME_BUDGET, engine=DEFAULT_ENGINE,
+                 fetch_engine=None, pool=None, job_id=0, horizon=1):
         super().__init__()
+        self.job_id = job_id
+        self.horizon = horizon
         self.symbol = symbol
         self.period = period
         self.interval = interval
-        self.predictor = StockPricePredictor()
+        self.provider = provider or get_provider()
+        self.time_budget = time_budget
+        self.engine = engine
+        self.fetch_engine = fetch_engine or get_fetch_engine()
+        self.pool = pool or get_training_pool()
+        self._future = None
+        self._cancel_event = None
+        self._cancelled = False
+        self._favorites = []
 
     def fetch_and_validate(self):
-        df = yf.download(self.symbol, period=self.period, interval=self.interval)
+        from App.Data.BarStore import BarStore
+
+        df = BarStore.get_bars(self.symbol, self.period, self.interval, provider=self.provider)
 
         if df.empty:
             raise ValueError(f"No data for {self.symbol}")
 
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = [c[0] for c in df.columns]
-
-        for col in self.REQUIRED_COLUMNS:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
         df = df.dropna()
 
         if len(df) < self.MIN_DATA_POINTS:
@@ -143,41 +74,152 @@ class PredictionWorker(QThread):
 
     def get_company_name(self):
         try:
-            ticker = yf.Ticker(self.symbol)
-            info = ticker.info
-            return info.get('longName', info.get('shortName', self.symbol.upper()))
-        except:
+            return NameCache.get_name(self.symbol.upper())
+        except Exception:
             return self.symbol.upper()
 
-    def run(self):
+    def fetch_favorite(self, ticker):
+        from App.Data.BarStore import BarStore
+
+        return BarStore.get_bars(ticker, self.period, self.interval, provider=self.provider).dropna()
+
+    def _collect_favorites(self, df, fetched):
+        """Świece całej listy ulubionych do treningu modelu globalnego"""
+        # Cel z listy też do niej należy - zbiór treningowy nie zależy od wybranego symbolu
+        frames = {}
+        fetched = iter(fetched)
+        for ticker in self._favorites:
+            if ticker == self.symbol.upper():
+                frames[ticker] = df
+                continue
+            result = next(fetched)
+            if isinstance(result, Exception):
+                print(f"[PredictionWorker] Skipping favorite {ticker}: {result}")
+            elif len(result) >= self.MIN_DATA_POINTS:
+                frames[ticker] = result
+        return frames
+
+    def predict_local(self, df):
+        # Silniki NumPy w puli wątków FetchEngine - proces spawn i IPC kosztowałyby więcej niż trening
+        predictor = load_engine(self.engine)(time_budget=self.time_budget)
+        return predictor.fit_predict(df, self.symbol, self.interval, horizon=self.horizon)
+
+    def start(self):
+        self._emit(self.progress, "loading")
+        calls = [
+            (self.fetch_and_validate, (), {}),
+            (self.get_company_name, (), {}),
+        ]
+        if uses_pool(self.engine):
+            # Event anulowania też w puli wątków silnika: pierwsze wywołanie uruchamia proces
+            # Managera, a każde kolejne to zapytanie IPC - nie może blokować pętli asyncio
+            calls.append((self.pool.new_cancel_event, (), {}))
+        if uses_favorites(self.engine):
+            self._favorites = list(dict.fromkeys(ticker.upper() for ticker in HomeConfigExtension.load_favorites()))
+            # Ulubione pobierane równolegle z celem, a nie po kolei przed treningiem
+            calls += [
+                (self.fetch_favorite, (ticker,), {})
+                for ticker in self._favorites if ticker != self.symbol.upper()
+            ]
+        self._future = self.fetch_engine.gather(calls, host=self.provider.host)
+        self._future.add_done_callback(self._on_loaded)
+
+    def _emit(self, signal, value):
+        if self._cancelled:
+            return
+        try:
+            signal.emit(self.job_id, value)
+        except RuntimeError:
+            # Strona została zamknięta zanim przyszedł wynik
+            pass
+
+    def _on_loaded(self, future):
+        # Wywoływane w wątku silnika - sygnały trafią do wątku GUI jako queued
+        if future.cancelled() or self._cancelled:
+            return
+        try:
+            df, company_name, *rest = future.result()
+            if isinstance(df, Exception):
+                raise df
+            if not uses_pool(self.engine):
+                self._emit(self.progress, "calculating")
+                self._future = self.fetch_engine.run(self.predict_local, df)
+                self._future.add_done_callback(lambda done: self._on_predicted(done, df, company_name))
+                return
+
+            cancel_event, *fetched = rest
+            if isinstance(cancel_event, Exception):
+                raise cancel_event
+            favorites = self._collect_favorites(df, fetched) if uses_favorites(self.engine) else None
+            # Event przypisany przed sprawdzeniem flagi - cancel() z GUI zawsze go zobaczy
+            self._cancel_event = cancel_event
+            if self._cancelled:
+                return
+            self._emit(self.progress, "calculating")
+            # pool.submit bierze blokadę puli i może uruchomić proces - nie w wątku pętli asyncio
+            self._future = self.fetch_engine.run(
+                self.pool.submit, self.engine, df, self.symbol, self.interval, self.time_budget,
+                self._cancel_event, favorites=favorites, horizon=self.horizon
+            )
+        except Exception as e:
+            self._emit(self.error, str(e))
+            return
+
+        self._future.add_done_callback(lambda done: self._on_submitted(done, df, company_name))
+
+    def _on_submitted(self, future, df, company_name):
+        if future.cancelled():
+            return
         try:
-            self.progress.emit("loading")
-            df = self.fetch_and_validate()
-
-            company_name = self.get_company_name()
-
-            self.progress.emit("calculating")
-            X_train, y_train, X_test, y_test, seq_len, scaled = self.predictor.prepare_data(df)
-
-            self.predictor.build_model(seq_len)
-            self.predictor.train(X_train, y_train)
-            accuracy_metrics = self.predictor.calculate_accuracy(X_test, y_test)
-            next_price = self.predictor.predict_next(scaled, seq_len)
-            current_price = df["Close"].iloc[-1]
-
-            self.finished.emit({
-                "df": df,
-                "next_price": next_price,
-                "current_price": current_price,
-                "symbol": self.symbol,
-                "company_name": company_name,  # Dodane!
-                "accuracy": accuracy_metrics["accuracy"],
-                "rmse": accuracy_metrics["rmse"],
-                "mape": accuracy_metrics["mape"]
-            })
+            pool_future = future.result()
+        except Exception as e:
+            self._emit(self.error, str(e))
+            return
+        # Future puli przypisany przed sprawdzeniem flagi - cancel() z GUI zawsze go zobaczy
+        self._future = pool_future
+        if self._cancelled:
+            pool_future.cancel()
+            return
+        pool_future.add_done_callback(lambda done: self._on_predicted(done, df, company_name))
 
+    def _on_predicted(self, future, df, company_name):
+        if future.cancelled() or self._cancelled:
+            return
+        try:
+            result = future.result()
         except Exception as e:
-            self.error.emit(str(e))
+            self._emit(self.error, str(e))
+            return
+
+        self._emit(self.finished, {
+            "df": df,
+            "current_price": df["Close"].iloc[-1],
+            "symbol": self.symbol,
+            "company_name": company_name,  # Dodane!
+            "engine": self.engine,
+            **result,
+        })
+
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
+
+    def cancel(self):
+        self._cancelled = True
+        if self._future is not None:
+            # Pobieranie czekające na semafor albo zadanie w kolejce puli nie wystartuje;
+            # już wysłane zapytanie kończy się w tle i tylko zasila BarStore
+            self._future.cancel()
+        if self._cancel_event is not None:
+            try:
+                self._cancel_event.set()
+            except Exception as e:
+                print(f"[PredictionWorker] Cancel signal failed: {e}")
+
+    def quit(self):
+        self.cancel()
+
+    def wait(self):
+        pass
 
 # --- Custom Widgety ---
 
@@ -199,35 +241,66 @@ class PlaceholderWidget(AutoRefreshWidget):
 
 
 class ChartWidget(AutoRefreshWidget):
+    """Wykres świecowy z prognozą"""
+
     def __init__(self):
         super().__init__()
         self.chart_cfg = ThemeManager.get_current_theme().get("chart", {})
-        self._setup_canvas()
+        self.figure = None
+        self.canvas = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
         self.hide()
 
     def _setup_canvas(self):
+        # matplotlib, mplfinance i pandas dopiero przy pierwszym rysowaniu, nie przy starcie aplikacji
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         self.figure = Figure(facecolor=self.chart_cfg.get("bg_color", "white"))
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        layout.addWidget(self.canvas)
+        self._layout.addWidget(self.canvas)
 
     def _refresh_content(self):
         self.chart_cfg = ThemeManager.get_current_theme().get("chart", {})
+        if self.figure is None:
+            return
         self.figure.patch.set_facecolor(self.chart_cfg.get("bg_color", "white"))
         if self.isVisible():
             self.canvas.draw()
 
-    def update_chart(self, df, next_price, selected_range="15m"):
+    @staticmethod
+    def _with_forecast(df, forecast):
+        """Dokleja puste świece na przyszłe terminy (krok = mediana odstępu) z prognozowaną ścieżką."""
+        import numpy as np
+        import pandas as pd
+
+        step = pd.Series(df.index).diff().median()
+        future_index = pd.DatetimeIndex([df.index[-1] + step * (i + 1) for i in range(len(forecast))])
+        future = pd.DataFrame(np.nan, index=future_index, columns=df.columns)
+        df_plot = pd.concat([df, future])
+
+        df_plot["Prediction"] = np.nan
+        df_plot.loc[future_index, "Prediction"] = forecast
+        # Linia ścieżki zaczyna się od ostatniego zamknięcia
+        df_plot["Path"] = df_plot["Prediction"]
+        df_plot.loc[df.index[-1], "Path"] = df["Close"].iloc[-1]
+        return df_plot
+
+    def update_chart(self, df, forecast, selected_range="15m"):
+        import numpy as np
+        import mplfinance as mpf
+
+        if self.figure is None:
+            self._setup_canvas()
         self.figure.clear()
 
         range_config = PREDICTION_RANGES.get(selected_range, PREDICTION_RANGES["15m"])
-        df_plot = df.tail(range_config["tail"]).copy()
-        df_plot["Prediction"] = np.nan
-        df_plot.iloc[-1, df_plot.columns.get_loc("Prediction")] = next_price
+        forecast = np.atleast_1d(np.asarray(forecast, dtype=float))
+        df_plot = self._with_forecast(df.tail(range_config["tail"]), forecast)
 
         cfg = self.chart_cfg
 
@@ -254,14 +327,22 @@ class ChartWidget(AutoRefreshWidget):
                 y_on_right=False
             )
 
-            add_plot = mpf.make_addplot(
-                df_plot["Prediction"],
-                scatter=True,
-                markersize=cfg.get("prediction_marker", {}).get("size", 200),
-                marker=cfg.get("prediction_marker", {}).get("marker", "*"),
-                color=cfg.get("prediction_color", "gold"),
-                ax=ax,
-            )
+            add_plot = [
+                mpf.make_addplot(
+                    df_plot["Path"],
+                    color=cfg.get("prediction_color", "gold"),
+                    linestyle="--",
+                    ax=ax,
+                ),
+                mpf.make_addplot(
+                    df_plot["Prediction"],
+                    scatter=True,
+                    markersize=cfg.get("prediction_marker", {}).get("size", 200),
+                    marker=cfg.get("prediction_marker", {}).get("marker", "*"),
+                    color=cfg.get("prediction_color", "gold"),
+                    ax=ax,
+                ),
+            ]
 
             mpf.plot(
                 df_plot, type="candle", style=style, ylabel="", xrotation=0,
@@ -296,13 +377,19 @@ class ControlPanelWidget(AutoRefreshWidget):
 
         self.inp_symbol = SmartLineEdit(placeholder_key="enter_symbol_placeholder")
         self.cmb_range = SmartComboBox(items=list(PREDICTION_RANGES.keys()))
+        self.cmb_engine = SmartComboBox(items=list(PREDICTION_ENGINES.keys()))
+        self.cmb_horizon = SmartComboBox(items=[str(steps) for steps in FORECAST_HORIZONS])
 
         CONTROLLER.set_symbol_input(self.inp_symbol)
         CONTROLLER.set_range_combo(self.cmb_range)
+        CONTROLLER.set_engine_combo(self.cmb_engine)
+        CONTROLLER.set_horizon_combo(self.cmb_horizon)
 
         grid = LayoutHelper.create_form_grid([
             ("symbol_label", self.inp_symbol),
             ("prediction_range", self.cmb_range),
+            ("prediction_engine", self.cmb_engine),
+            ("forecast_horizon", self.cmb_horizon),
         ])
         layout.addLayout(grid)
 
@@ -313,6 +400,13 @@ class ControlPanelWidget(AutoRefreshWidget):
         CONTROLLER.set_calc_button(self.btn_calc)
         layout.addWidget(self.btn_calc)
 
+        self.btn_cancel = SmartButton(
+            tr_key="cancel_button",
+            on_click=CONTROLLER.on_cancel
+        )
+        CONTROLLER.set_cancel_button(self.btn_cancel)
+        layout.addWidget(self.btn_cancel)
+
         layout.addStretch(1)
 
     def _refresh_content(self):
@@ -327,6 +421,7 @@ class PriceSummaryWidget(AutoRefreshWidget):
         self._symbol = None
         self._company_name = None
         self._accuracy = None
+        self._walk_forward = None
         self._setup_ui()
         self.hide()
 
@@ -425,6 +520,10 @@ class PriceSummaryWidget(AutoRefreshWidget):
 
         acc_text = ThemeManager.get_translation("prediction_accuracy")
         display_text = f"({acc_text}: {accuracy:.1f}%)"
+        # Po douczeniu: wynik na nowych świecach obok metryk z pełnego treningu
+        if self._walk_forward is not None:
+            wf_text = ThemeManager.get_translation("walk_forward_accuracy")
+            display_text += f" ({wf_text}: {self._walk_forward['accuracy']:.1f}%, n={self._walk_forward['windows']})"
 
         # Kolorowanie w zależności od wartości
         if accuracy >= 70:
@@ -491,9 +590,11 @@ class PriceSummaryWidget(AutoRefreshWidget):
         self._company_name = company_name
 
         # Ekstrakcja accuracy z dict
+        self._walk_forward = None
         if accuracy is not None:
             if isinstance(accuracy, dict) and "accuracy" in accuracy:
                 self._accuracy = accuracy["accuracy"]
+                self._walk_forward = accuracy.get("walk_forward")
             elif isinstance(accuracy, (int, float)):
                 self._accuracy = accuracy
             else:
@@ -520,25 +621,49 @@ class PredictionController:
 
         self.symbol_input = None
         self.calc_btn = None
+        self.cancel_btn = None
         self.selected_range = "15m"
+        self.selected_engine = DEFAULT_ENGINE
+        self.selected_horizon = FORECAST_HORIZONS[0]
         self.placeholder = None
         self.chart = None
         self.price_summary = None
         self.worker = None
+        self.prefetcher = None
+        self._symbol_timer = None
+        self._job_id = 0
 
         self._initialized = True
 
     def set_symbol_input(self, widget):
         self.symbol_input = widget
+        self.prefetcher = Prefetcher(parent=widget)
+        # Trwający trening przerywa dopiero ustalony (po debounce) inny symbol, nie każdy klawisz
+        self._symbol_timer = QTimer(widget)
+        self._symbol_timer.setSingleShot(True)
+        self._symbol_timer.setInterval(Prefetcher.DEBOUNCE_MS)
+        self._symbol_timer.timeout.connect(self._on_symbol_settled)
         widget.textChanged.connect(self._on_symbol_changed)
 
     def set_calc_button(self, widget):
         self.calc_btn = widget
 
+    def set_cancel_button(self, widget):
+        self.cancel_btn = widget
+        widget.setEnabled(False)
+
     def set_range_combo(self, widget):
         widget.setCurrentText("15m")
         widget.currentTextChanged.connect(self._on_range_changed)
 
+    def set_engine_combo(self, widget):
+        widget.setCurrentText(self.selected_engine)
+        widget.currentTextChanged.connect(self._on_engine_changed)
+
+    def set_horizon_combo(self, widget):
+        widget.setCurrentText(str(self.selected_horizon))
+        widget.currentTextChanged.connect(self._on_horizon_changed)
+
     def set_placeholder(self, widget):
         self.placeholder = widget
 
@@ -550,10 +675,50 @@ class PredictionController:
 
     def _on_symbol_changed(self, text):
         if self.calc_btn:
-            self.calc_btn.setEnabled(bool(text.strip()))
+            self.calc_btn.setEnabled(bool(text.strip()) and self.worker is None)
+        self._symbol_timer.start()
+        self._schedule_prefetch()
+
+    def _on_symbol_settled(self):
+        # Wynik dla poprzedniego symbolu byłby już nieaktualny
+        if self.worker is not None and self.symbol_input.text().strip().upper() != self.worker.symbol:
+            self._cancel_job()
 
     def _on_range_changed(self, text):
         self.selected_range = text
+        self._cancel_job()
+        self._schedule_prefetch()
+
+    def _set_running(self, running):
+        if self.calc_btn:
+            has_symbol = bool(self.symbol_input and self.symbol_input.text().strip())
+            self.calc_btn.setEnabled(not running and has_symbol)
+        if self.cancel_btn:
+            self.cancel_btn.setEnabled(running)
+
+    def _cancel_job(self):
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        self.worker = None
+        self._set_running(False)
+
+    def _is_current(self, job_id):
+        return self.worker is not None and self.worker.job_id == job_id
+
+    def _on_engine_changed(self, text):
+        self.selected_engine = text
+
+    def _on_horizon_changed(self, text):
+        self.selected_horizon = int(text)
+
+    def _schedule_prefetch(self):
+        if not self.prefetcher or not self.symbol_input:
+            return
+        range_config = PREDICTION_RANGES.get(self.selected_range, PREDICTION_RANGES["15m"])
+        self.prefetcher.schedule(
+            self.symbol_input.text(), range_config["period"], range_config["interval"]
+        )
 
     def on_calculate(self):
         if not self.symbol_input:
@@ -570,26 +735,40 @@ class PredictionController:
 
         range_config = PREDICTION_RANGES.get(self.selected_range, PREDICTION_RANGES["15m"])
 
-        if self.calc_btn:
-            self.calc_btn.setEnabled(False)
+        self._cancel_job()
+        if self.prefetcher:
+            self.prefetcher.stop_debounce()
 
-        self.worker = PredictionWorker(symbol, range_config["period"], range_config["interval"])
+        self._job_id += 1
+        self.worker = PredictionWorker(
+            symbol, range_config["period"], range_config["interval"],
+            engine=self.selected_engine, job_id=self._job_id, horizon=self.selected_horizon
+        )
         self.worker.finished.connect(self.on_finished)
         self.worker.error.connect(self.on_error)
+        self._set_running(True)
         self.worker.start()
 
-    def on_finished(self, result):
-        if self.calc_btn:
-            self.calc_btn.setEnabled(True)
+    def on_cancel(self):
+        self._cancel_job()
+
+    def on_finished(self, job_id, result):
+        if not self._is_current(job_id):
+            return
+        self.worker = None
+        self._set_running(False)
         if self.placeholder:
             self.placeholder.hide()
         if self.chart:
-            self.chart.update_chart(result["df"], result["next_price"], self.selected_range)
+            self.chart.update_chart(
+                result["df"], result.get("forecast", [result["next_price"]]), self.selected_range
+            )
         if self.price_summary:
             accuracy_metrics = {
                 "accuracy": result.get("accuracy", 0),
                 "rmse": result.get("rmse", 0),
-                "mape": result.get("mape", 0)
+                "mape": result.get("mape", 0),
+                "walk_forward": result.get("walk_forward"),
             }
             self.price_summary.update_prices(
                 result["current_price"],
@@ -600,9 +779,11 @@ class PredictionController:
 
             )
 
-    def on_error(self, error_msg):
-        if self.calc_btn:
-            self.calc_btn.setEnabled(True)
+    def on_error(self, job_id, error_msg):
+        if not self._is_current(job_id):
+            return
+        self.worker = None
+        self._set_running(False)
 
         QMessageBox.critical(
             None,
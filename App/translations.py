@@ -15,10 +15,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Enter symbol (e.g., NVDA, AAPL)",
         "enter_symbol_placeholder": "e.g., AAPL",
         "prediction_range": "Prediction Range:",
+        "prediction_engine": "Prediction Engine:",
+        "forecast_horizon": "Forecast Horizon:",
         "calculate_button": "Calculate Prediction",
         "current_price": "Current Price",
         "predicted_price": "Predicted Price",
         "prediction_accuracy": "Accuracy",
+        "walk_forward_accuracy": "New bars",
         "loading": "Loading data...",
         "calculating": "Calculating prediction...",
         "error_title": "Error",
@@ -53,10 +56,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Wpisz symbol (np. NVDA, AAPL)",
         "enter_symbol_placeholder": "np. AAPL",
         "prediction_range": "Zakres Predykcji:",
+        "prediction_engine": "Silnik Predykcji:",
+        "forecast_horizon": "Horyzont Prognozy:",
         "calculate_button": "Oblicz Predykcję",
         "current_price": "Obecna Cena",
         "predicted_price": "Przewidywana Cena",
         "prediction_accuracy": "Dokładność",
+        "walk_forward_accuracy": "Nowe świece",
         "loading": "Ładowanie danych...",
         "calculating": "Obliczanie predykcji...",
         "error_title": "Błąd",
@@ -91,10 +97,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Symbol eingeben (z.B. NVDA, AAPL)",
         "enter_symbol_placeholder": "z.B. AAPL",
         "prediction_range": "Vorhersagebereich:",
+        "prediction_engine": "Vorhersagemodell:",
+        "forecast_horizon": "Prognosehorizont:",
         "calculate_button": "Vorhersage Berechnen",
         "current_price": "Aktueller Preis",
         "predicted_price": "Prognostizierter Preis",
         "prediction_accuracy": "Genauigkeit",
+        "walk_forward_accuracy": "Neue Kerzen",
         "loading": "Daten werden geladen...",
         "calculating": "Vorhersage wird berechnet...",
         "error_title": "Fehler",
@@ -129,10 +138,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Entrez le symbole (ex. NVDA, AAPL)",
         "enter_symbol_placeholder": "ex. AAPL",
         "prediction_range": "Plage de Prédiction:",
+        "prediction_engine": "Moteur de Prédiction:",
+        "forecast_horizon": "Horizon de Prévision:",
         "calculate_button": "Calculer la Prédiction",
         "current_price": "Prix Actuel",
         "predicted_price": "Prix Prévu",
         "prediction_accuracy": "Précision",
+        "walk_forward_accuracy": "Nouvelles bougies",
         "loading": "Chargement des données...",
         "calculating": "Calcul de la prédiction...",
         "error_title": "Erreur",
@@ -167,10 +179,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Ingrese símbolo (ej. NVDA, AAPL)",
         "enter_symbol_placeholder": "ej. AAPL",
         "prediction_range": "Rango de Predicción:",
+        "prediction_engine": "Motor de Predicción:",
+        "forecast_horizon": "Horizonte de Predicción:",
         "calculate_button": "Calcular Predicción",
         "current_price": "Precio Actual",
         "predicted_price": "Precio Predicho",
         "prediction_accuracy": "Precisión",
+        "walk_forward_accuracy": "Velas nuevas",
         "loading": "Cargando datos...",
         "calculating": "Calculando predicción...",
         "error_title": "Error",
@@ -205,10 +220,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Inserisci simbolo (es. NVDA, AAPL)",
         "enter_symbol_placeholder": "es. AAPL",
         "prediction_range": "Intervallo di Previsione:",
+        "prediction_engine": "Motore di Previsione:",
+        "forecast_horizon": "Orizzonte di Previsione:",
         "calculate_button": "Calcola Previsione",
         "current_price": "Prezzo Attuale",
         "predicted_price": "Prezzo Previsto",
         "prediction_accuracy": "Accuratezza",
+        "walk_forward_accuracy": "Nuove candele",
         "loading": "Caricamento dati...",
         "calculating": "Calcolo previsione...",
         "error_title": "Errore",
@@ -243,10 +261,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Digite o símbolo (ex. NVDA, AAPL)",
         "enter_symbol_placeholder": "ex. AAPL",
         "prediction_range": "Intervalo de Previsão:",
+        "prediction_engine": "Motor de Previsão:",
+        "forecast_horizon": "Horizonte de Previsão:",
         "calculate_button": "Calcular Previsão",
         "current_price": "Preço Atual",
         "predicted_price": "Preço Previsto",
         "prediction_accuracy": "Precisão",
+        "walk_forward_accuracy": "Novas velas",
         "loading": "Carregando dados...",
         "calculating": "Calculando previsão...",
         "error_title": "Erro",
@@ -281,10 +302,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "输入代码（如 NVDA, AAPL）",
         "enter_symbol_placeholder": "例如 AAPL",
         "prediction_range": "预测范围：",
+        "prediction_engine": "预测引擎：",
+        "forecast_horizon": "预测步数：",
         "calculate_button": "计算预测",
         "current_price": "当前价格",
         "predicted_price": "预测价格",
         "prediction_accuracy": "准确率",
+        "walk_forward_accuracy": "新K线",
         "loading": "正在加载数据...",
         "calculating": "正在计算预测...",
         "error_title": "错误",
@@ -319,10 +343,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "प्रतीक दर्ज करें (जैसे NVDA, AAPL)",
         "enter_symbol_placeholder": "जैसे AAPL",
         "prediction_range": "पूर्वानुमान सीमा:",
+        "prediction_engine": "पूर्वानुमान इंजन:",
+        "forecast_horizon": "पूर्वानुमान अवधि:",
         "calculate_button": "पूर्वानुमान निकालें",
         "current_price": "वर्तमान मूल्य",
         "predicted_price": "अनुमानित मूल्य",
         "prediction_accuracy": "सटीकता",
+        "walk_forward_accuracy": "नई कैंडल",
         "loading": "डेटा लोड हो रहा है...",
         "calculating": "पूर्वानुमान की गणना...",
         "error_title": "त्रुटि",
@@ -357,10 +384,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "コードを入力（例：NVDA, AAPL）",
         "enter_symbol_placeholder": "例：AAPL",
         "prediction_range": "予測範囲：",
+        "prediction_engine": "予測エンジン：",
+        "forecast_horizon": "予測期間：",
         "calculate_button": "予測を計算",
         "current_price": "現在価格",
         "predicted_price": "予測価格",
         "prediction_accuracy": "精度",
+        "walk_forward_accuracy": "新しい足",
         "loading": "データを読み込み中...",
         "calculating": "予測を計算中...",
         "error_title": "エラー",
@@ -395,10 +425,13 @@ TRANSLATIONS = {
         "symbol_placeholder": "Введите тикер (например NVDA, AAPL)",
         "enter_symbol_placeholder": "например AAPL",
         "prediction_range": "Диапазон прогноза:",
+        "prediction_engine": "Модель прогноза:",
+        "forecast_horizon": "Горизонт прогноза:",
         "calculate_button": "Рассчитать прогноз",
         "current_price": "Текущая цена",
         "predicted_price": "Прогнозируемая цена",
         "prediction_accuracy": "Точность",
+        "walk_forward_accuracy": "Новые свечи",
         "loading": "Загрузка данных...",
         "calculating": "Расчёт прогноза...",
         "error_title": "Ошибка",
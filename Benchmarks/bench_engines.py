@@ -0,0 +1,90 @@
+"""
+Porównanie silników predykcji (LSTM, Ridge AR, Holt): czas do prognozy oraz
+błąd prognoz o krok naprzód na części testowej (accuracy / RMSE / MAPE).
+
+Domyślnie na syntetycznym błądzeniu losowym; z --replay-dir na nagranych
+notowaniach (Benchmarks/record_fixtures.py):
+    python Benchmarks/bench_engines.py --sizes 80 250 1000
+    python Benchmarks/bench_engines.py --replay-dir fixtures --symbols NVDA SPY --interval 1d
+"""
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_bars(size, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, size)))
+    index = pd.date_range("2020-01-01", periods=size, freq="D", tz="UTC")
+    return pd.DataFrame({"Close": closes}, index=index)
+
+
+def load_engines(skip_lstm):
+    """Zwraca {nazwa: klasa} i czas importu modułów (TensorFlow liczy się do czasu LSTM)."""
+    started = time.perf_counter()
+    engines_module = importlib.import_module("App.Models.Engines")
+    timings = {"numpy": time.perf_counter() - started}
+    engines = {
+        "Ridge AR": engines_module.RidgeARPredictor,
+        "Holt": engines_module.HoltPredictor,
+    }
+
+    if not skip_lstm:
+        started = time.perf_counter()
+        predictor = importlib.import_module("App.Models.Predictor")
+        timings["lstm"] = time.perf_counter() - started
+        engines = {"LSTM": predictor.StockPricePredictor, **engines}
+
+    return engines, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[80, 250, 1000])
+    parser.add_argument("--replay-dir", type=Path, help="katalog z nagranymi notowaniami (ReplayProvider)")
+    parser.add_argument("--symbols", nargs="+", default=["NVDA"])
+    parser.add_argument("--interval", default="1d")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--skip-lstm", action="store_true", help="bez TensorFlow")
+    args = parser.parse_args()
+
+    engines, import_times = load_engines(args.skip_lstm)
+    print("import: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in import_times.items()))
+
+    if args.replay_dir:
+        from App.Data.Providers import ReplayProvider
+        provider = ReplayProvider(args.replay_dir)
+        series = {
+            f"{symbol} {args.interval}": provider.get_history(symbol, args.interval).dropna()
+            for symbol in args.symbols
+        }
+    else:
+        series = {f"random walk {size}": synthetic_bars(size) for size in args.sizes}
+
+    print(f"{'series':<20} {'engine':<10} {'time [ms]':>10} {'accuracy':>9} {'rmse':>9} {'mape':>7}")
+    for label, df in series.items():
+        for name, engine in engines.items():
+            # LSTM raz (sekundy na przebieg), silniki NumPy - najlepszy z kilku
+            repeats = 1 if name == "LSTM" else args.repeats
+            best, result = None, None
+            for _ in range(repeats):
+                started = time.perf_counter()
+                result = engine().fit_predict(df)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+
+            print(
+                f"{label:<20} {name:<10} {best * 1000:>10.1f} {result['accuracy']:>8.2f}% "
+                f"{result['rmse']:>9.3f} {result['mape']:>6.2f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
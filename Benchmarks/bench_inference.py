@@ -0,0 +1,96 @@
+"""
+Narzut pojedynczego wywołania predykcji LSTM: model.predict(..., verbose=0)
+kontra skompilowana raz funkcja StockPricePredictor.infer.
+
+Trzy przypadki: jedno okno (dawne predict_next), okna testowe + ostatnie okno
+(dawne calculate_accuracy + predict_next) oraz ścieżka `horizon` świec.
+Wagi są losowe - mierzony jest tylko czas, wyniki obu ścieżek są porównywane.
+
+    python Benchmarks/bench_inference.py --test-windows 200 --horizon 10
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from App.Models.Predictor import StockPricePredictor
+
+
+def measure(func, repeats):
+    func()  # rozgrzewka: śledzenie grafu / budowa pętli predykcji
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def legacy_path(model, last_window, horizon):
+    window, path = last_window.copy(), []
+    for _ in range(horizon):
+        next_value = model.predict(window, verbose=0)
+        path.append(next_value[0, 0])
+        window = np.concatenate([window[:, 1:, :], next_value[:, np.newaxis, :]], axis=1)
+    return np.array(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seq-len", type=int, default=30)
+    parser.add_argument("--test-windows", type=int, default=200)
+    parser.add_argument("--horizon", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    predictor = StockPricePredictor()
+    predictor.build_model(args.seq_len)
+    model = predictor.model
+
+    rng = np.random.default_rng(0)
+    X_test = rng.random((args.test_windows, args.seq_len, 1)).astype(np.float32)
+    last = rng.random((1, args.seq_len, 1)).astype(np.float32)
+    empty = last[:0]
+
+    legacy_test = model.predict(X_test, verbose=0)[:, 0]
+    legacy_next = model.predict(last, verbose=0)[0, 0]
+    predicted, paths = predictor.infer(X_test, last, args.horizon)
+    assert np.allclose(predicted, legacy_test, atol=1e-5)
+    assert np.isclose(paths[0, 0], legacy_next, atol=1e-5)
+    assert np.allclose(paths[0], legacy_path(model, last, args.horizon), atol=1e-4)
+    # Domyślna ścieżka calculate_accuracy (bez gotowych prognoz) to infer z horizon=0
+    predictor.scaler.fit(rng.random((args.seq_len, 1)))
+    y_test = rng.random((args.test_windows, 1))
+    assert predictor.calculate_accuracy(X_test, y_test) == predictor.calculate_accuracy(X_test, y_test, predicted)
+
+    cases = [
+        ("1 window", lambda: model.predict(last, verbose=0), lambda: predictor.infer(empty, last, 1)),
+        (
+            f"{args.test_windows} test + last",
+            lambda: (model.predict(X_test, verbose=0), model.predict(last, verbose=0)),
+            lambda: predictor.infer(X_test, last, 1),
+        ),
+        (
+            f"path {args.horizon} bars",
+            lambda: legacy_path(model, last, args.horizon),
+            lambda: predictor.infer(empty, last, args.horizon),
+        ),
+    ]
+
+    print(f"{'case':<20} {'predict [ms]':>13} {'infer [ms]':>11} {'speedup':>8}")
+    for label, legacy, compiled in cases:
+        legacy_time = measure(legacy, args.repeats)
+        compiled_time = measure(compiled, args.repeats)
+        print(
+            f"{label:<20} {legacy_time * 1000:>13.2f} {compiled_time * 1000:>11.2f} "
+            f"{legacy_time / compiled_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
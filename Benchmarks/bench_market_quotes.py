@@ -0,0 +1,100 @@
+"""
+Porównanie czasu odświeżania listy obserwowanych:
+  sequential - stara ścieżka (info + history dla każdego tickera osobno),
+  per-ticker - osobne zapytanie get_quote na ticker, równolegle przez FetchEngine,
+  closes     - jedno zbiorcze pobranie dziennych świec (MarketQuotes.fetch_last_closes),
+  quotes     - ścieżka MarketWorker: jedno zbiorcze zapytanie o notowania (MarketQuotes.fetch_quotes).
+
+Uruchomienie z katalogu projektu:
+    python Benchmarks/bench_market_quotes.py --sizes 1 5 10 25 50
+    python Benchmarks/bench_market_quotes.py --replay fixtures --latency-ms 150
+
+Z --replay dane idą z nagrania (ReplayProvider), a każde zapytanie kosztuje
+--latency-ms; kolumna sequential jest wtedy pomijana.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.Data.FetchEngine import FetchEngine
+from App.Data.Providers import ReplayProvider, YFinanceProvider
+from App.Data.Quotes import MarketQuotes
+
+
+WATCHLIST = [
+    "AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "AVGO", "JPM", "V",
+    "UNH", "XOM", "MA", "JNJ", "PG", "HD", "COST", "ABBV", "MRK", "CVX",
+    "KO", "PEP", "ADBE", "CRM", "WMT", "BAC", "NFLX", "AMD", "TMO", "LIN",
+    "ORCL", "MCD", "ACN", "CSCO", "ABT", "INTC", "DIS", "WFC", "QCOM", "TXN",
+    "SPY", "QQQ", "DIA", "IWM", "BTC-USD", "ETH-USD", "^GSPC", "^DJI", "^IXIC", "^N225",
+]
+
+
+def sequential_quotes(tickers, provider, engine):
+    import yfinance as yf
+
+    data = {}
+    for ticker in tickers:
+        stock = yf.Ticker(ticker)
+        info = stock.info
+        hist = stock.history(period="2d")
+        data[ticker] = (info.get("longName"), hist["Close"].iloc[-1] if not hist.empty else 0.0)
+    return data
+
+
+def per_ticker_quotes(tickers, provider, engine):
+    calls = [(provider.get_quote, (ticker,), {}) for ticker in tickers]
+    return engine.gather(calls, host=provider.host).result()
+
+
+def batched_closes(tickers, provider, engine):
+    return MarketQuotes.fetch_last_closes(tickers, provider=provider)
+
+
+def batched_quotes(tickers, provider, engine):
+    return MarketQuotes.fetch_quotes(tickers, provider=provider)
+
+
+def measure(func, tickers, provider, engine, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(tickers, provider, engine)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--replay", help="katalog nagrania ReplayProvider zamiast sieci")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="opóźnienie zapytania z --replay")
+    parser.add_argument("--skip-sequential", action="store_true",
+                        help="Pomiń starą ścieżkę (dla dużych list trwa bardzo długo)")
+    args = parser.parse_args()
+
+    if args.replay:
+        provider = ReplayProvider(args.replay, latency=args.latency_ms / 1000)
+    else:
+        provider = YFinanceProvider()
+    engine = FetchEngine()
+
+    paths = [("per-ticker", per_ticker_quotes), ("closes", batched_closes), ("quotes", batched_quotes)]
+    if not (args.replay or args.skip_sequential):
+        paths.insert(0, ("sequential", sequential_quotes))
+
+    print(f"{'size':>6} " + " ".join(f"{label + ' [s]':>16}" for label, _ in paths))
+    for size in args.sizes:
+        tickers = WATCHLIST[:size]
+        timings = [measure(func, tickers, provider, engine, args.repeats) for _, func in paths]
+        print(f"{len(tickers):>6} " + " ".join(f"{timing:>16.3f}" for timing in timings))
+
+    engine.shutdown()
+
+
+if __name__ == "__main__":
+    main()
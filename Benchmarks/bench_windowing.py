@@ -0,0 +1,66 @@
+"""
+Mikrobenchmark budowania okien uczących w StockPricePredictor.prepare_data:
+dawna pętla Pythona + np.array kontra widok make_sequence_windows.
+
+    python Benchmarks/bench_windowing.py --sizes 1000 10000 100000
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from App.Models.Windowing import make_sequence_windows
+
+
+def legacy_windows(scaled, seq_len):
+    X, y = [], []
+    for i in range(len(scaled) - seq_len):
+        X.append(scaled[i:i + seq_len])
+        y.append(scaled[i + seq_len])
+    return np.array(X), np.array(y)
+
+
+def measure(func, scaled, seq_len, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(scaled, seq_len)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(scaled, seq_len)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--seq-len", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bars':>8} {'loop [ms]':>11} {'view [ms]':>11} {'speedup':>9} {'loop peak [MB]':>15} {'view peak [MB]':>15}")
+    for size in args.sizes:
+        scaled = np.random.default_rng(0).random((size, 1))
+
+        X_old, y_old = legacy_windows(scaled, args.seq_len)
+        X_new, y_new = make_sequence_windows(scaled, args.seq_len)
+        assert np.array_equal(X_old, X_new) and np.array_equal(y_old, y_new)
+
+        loop_time, loop_peak = measure(legacy_windows, scaled, args.seq_len, args.repeats)
+        view_time, view_peak = measure(make_sequence_windows, scaled, args.seq_len, args.repeats)
+        print(
+            f"{size:>8} {loop_time * 1000:>11.2f} {view_time * 1000:>11.3f} "
+            f"{loop_time / view_time:>8.0f}x {loop_peak / 2**20:>15.2f} {view_peak / 2**20:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Budżet importów przy starcie aplikacji: import Main (opcjonalnie też budowa
+głównego okna) w świeżym interpreterze nie może załadować w wątku GUI ciężkich
+modułów ani trwać dłużej niż --budget sekund. Kod wyjścia 1 = budżet przekroczony,
+więc skrypt nadaje się jako krok CI.
+
+    python Benchmarks/check_import_budget.py
+    python Benchmarks/check_import_budget.py --window --budget 1.5
+
+Brakujący resources_rc (generowany z resources.qrc) jest tworzony w katalogu
+tymczasowym przez pyside6-rcc.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Ładowane dopiero przez wykres, silniki predykcji albo pierwsze zapytanie o dane
+HEAVY_MODULES = (
+    "tensorflow", "keras", "sklearn", "scipy",
+    "pandas", "yfinance", "matplotlib", "mplfinance",
+)
+
+# Hook audytu "import" odpala w wątku, który importuje - liczą się tylko importy
+# wątku GUI; wątki danych (FetchEngine) mogą w tle ładować pandas/yfinance
+CHILD_CODE = """
+import json, sys, threading, time
+main_imports = set()
+def on_import(event, args):
+    if event == "import" and threading.current_thread() is threading.main_thread():
+        main_imports.add(args[0])
+sys.addaudithook(on_import)
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+if {window}:
+    from PySide6.QtWidgets import QApplication
+    from App.AppCreator import MainWindow
+    app = QApplication([])
+    window = MainWindow()
+    elapsed = time.perf_counter() - started
+print("REPORT " + json.dumps({{"elapsed": elapsed, "modules": sorted(main_imports)}}), flush=True)
+"""
+
+
+def resources_path(tmp_dir):
+    """Katalog z resources_rc do PYTHONPATH albo None, jeśli moduł już jest w repozytorium."""
+    sys.path.insert(0, str(ROOT))
+    if importlib.util.find_spec("resources_rc") is not None:
+        return None
+    subprocess.run(
+        ["pyside6-rcc", str(ROOT / "resources.qrc"), "-o", str(Path(tmp_dir) / "resources_rc.py")],
+        check=True,
+    )
+    return tmp_dir
+
+
+def run_child(module, window, extra_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), extra_path, env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_CODE.format(module=module, window=window)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    # Aplikacja może sama coś wypisać (np. wątki danych) - raport ma własny prefiks
+    report = next(
+        json.loads(line.removeprefix("REPORT "))
+        for line in completed.stdout.splitlines() if line.startswith("REPORT ")
+    )
+    # Linie "import time: self [us] | cumulative [us] | pakiet"
+    timings = []
+    for line in completed.stderr.splitlines():
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            timings.append((int(parts[1]), parts[2].strip()))
+    return report, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="Main")
+    parser.add_argument("--window", action="store_true", help="także konstrukcja MainWindow (offscreen)")
+    parser.add_argument("--budget", type=float, default=1.0, help="limit czasu [s]")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        extra_path = resources_path(tmp_dir)
+        runs = [run_child(args.module, args.window, extra_path) for _ in range(args.repeats)]
+
+    best = min(report["elapsed"] for report, _ in runs)
+    report, timings = runs[0]
+    heavy = sorted({name.split(".")[0] for name in report["modules"]} & set(HEAVY_MODULES))
+
+    print(f"import {args.module}{' + MainWindow' if args.window else ''}: {best:.2f}s (budget {args.budget:.2f}s)")
+    print("slowest imports (cumulative):")
+    for cumulative, name in sorted(timings, reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy modules imported on the main thread: {', '.join(heavy)}")
+        failed = True
+    if best > args.budget:
+        print(f"FAIL: {best:.2f}s exceeds the {args.budget:.2f}s budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""
+Nagrywa dane z Yahoo do katalogu, który potem odtwarza ReplayProvider.
+
+    python Benchmarks/record_fixtures.py fixtures/ --symbols NVDA SPY BTC-USD
+
+Uruchomienie aplikacji / benchmarków bez dostępu do sieci:
+    HOSSANNA_REPLAY_DIR=fixtures HOSSANNA_REPLAY_LATENCY_MS=150 python Main.py
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from App.Data.Providers import ReplayProvider
+
+
+# Te same pary (period, interval) co PREDICTION_RANGES w App/Pages/Prediction.py
+DEFAULT_RANGES = ["2d:5m", "3d:15m", "2wk:60m", "3mo:1d", "1y:1wk", "5y:1mo"]
+
+DEFAULT_SYMBOLS = [
+    "BTC-USD", "NVDA", "SPY",
+    "^GSPC", "^DJI", "^IXIC", "^FTSE", "^GDAXI", "^FCHI", "^N225", "000001.SS",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", help="Katalog docelowy")
+    parser.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS)
+    parser.add_argument("--ranges", nargs="+", default=DEFAULT_RANGES,
+                        help="Pary period:interval, np. 3mo:1d")
+    args = parser.parse_args()
+
+    ranges = [tuple(r.split(":", 1)) for r in args.ranges]
+    ReplayProvider.record(args.root, args.symbols, ranges)
+    print(f"Recorded {len(args.symbols)} symbols x {len(ranges)} ranges into {args.root}")
+
+
+if __name__ == "__main__":
+    main()
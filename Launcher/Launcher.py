@@ -1,11 +1,14 @@
 import sys
 import ctypes
+import importlib
 import os
 import socket
+import threading
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QProgressBar
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap
 import AppConfigurator
+from Launcher.StartupProfiler import StartupProfiler
 
 class AdminCheck:
     @staticmethod
@@ -43,32 +46,76 @@ class ConfigCheck:
         return config_path.is_file()
 
 
+class StartupWarmUp:
+    """
+    Rozgrzewka w tle, póki widać okno startowe: import ciężkich modułów
+    potrzebnych zaraz po starcie (notowania na stronie głównej, pierwszy wykres)
+    i wczytanie cache z dysku. Nic nie blokuje - wątek GUI, który potrzebuje
+    modułu w trakcie importu, po prostu czeka na jego koniec.
+    """
+
+    MODULES = (
+        "numpy",
+        "pandas",
+        "yfinance",
+        "App.Data.BarStore",
+        "matplotlib.backends.backend_qt5agg",
+        "mplfinance",
+    )
+
+    @staticmethod
+    def import_modules():
+        for name in StartupWarmUp.MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"[Launcher] Warm-up import of {name} failed: {e}")
+
+    @staticmethod
+    def load_caches():
+        try:
+            from App.Data.NameCache import NameCache
+            # Pusta lista - tylko wczytanie names.json do pamięci
+            NameCache.get_names([], fetch_missing=False)
+        except Exception as e:
+            print(f"[Launcher] Warm-up of caches failed: {e}")
+
+    @staticmethod
+    def start():
+        for task in (StartupWarmUp.import_modules, StartupWarmUp.load_caches):
+            threading.Thread(target=task, name=f"WarmUp-{task.__name__}", daemon=True).start()
+
+
 class LauncherWindow(QWidget):
+    # (indeks sprawdzenia, wynik) - emitowane z wątku sprawdzenia, odbierane w wątku GUI
+    check_finished = Signal(int, bool)
+    # Wszystkie sprawdzenia zakończone, wyniki zapisane w InitialSettings
+    loading_finished = Signal()
+
     def __init__(self):
         super().__init__()
 
         self.current_step = 0
 
+        # Sprawdzenia są niezależne - wszystkie startują naraz w osobnych wątkach
         self.steps = [
             (
                 AdminCheck.check_admin_permission,
                 AppConfigurator.InitialSettings.set_admin_value,
-                200,
                 "Checking permissions..."
             ),
             (
                 NetworkCheck.check_network_connection,
                 AppConfigurator.InitialSettings.set_network_value,
-                400,
                 "Checking network connection..."
             ),
             (
                 lambda: ConfigCheck.config_exists(AppConfigurator.AppSettings.app_folder_path()),
                 AppConfigurator.InitialSettings.set_first_start_value,
-                600,
                 "Checking configuration..."
             ),
         ]
+        self.pending_steps = set(range(len(self.steps)))
 
         self.total_steps = len(self.steps)
 
@@ -124,24 +171,41 @@ class LauncherWindow(QWidget):
         self.setLayout(layout)
         self.setStyleSheet("""QWidget {background-color: white;}""")
 
-        # Start checks after 500ms
-        QTimer.singleShot(500, self.execute_next_step)
-
-    def execute_next_step(self):
-        if self.current_step < self.total_steps:
-            check_func, setter_func, delay, status_text = self.steps[self.current_step]
-            self.status_label.setText(status_text)
+        self.check_finished.connect(self.on_check_finished)
+        self.start_checks()
+        StartupWarmUp.start()
 
-            # Execute check and store result
-            result = check_func()
-            setter_func(result)
+    def start_checks(self):
+        self.status_label.setText(self.steps[0][2])
+        for index, (check_func, _, status_text) in enumerate(self.steps):
+            threading.Thread(
+                target=self._run_check, args=(index, check_func, status_text),
+                name=f"LauncherCheck-{index}", daemon=True
+            ).start()
 
-            self.update_progress()
-
-            if self.current_step < self.total_steps:
-                QTimer.singleShot(delay, self.execute_next_step)
-            else:
-                QTimer.singleShot(delay, self.finish_loading)
+    def _run_check(self, index, check_func, status_text):
+        try:
+            with StartupProfiler.phase(status_text.rstrip(".")):
+                result = bool(check_func())
+        except Exception as e:
+            print(f"[Launcher] Check {index} failed: {e}")
+            result = False
+        try:
+            self.check_finished.emit(index, result)
+        except RuntimeError:
+            # Okno startowe już zamknięte
+            pass
+
+    def on_check_finished(self, index, result):
+        _, setter_func, _ = self.steps[index]
+        setter_func(result)
+        self.pending_steps.discard(index)
+        self.update_progress()
+
+        if self.pending_steps:
+            self.status_label.setText(self.steps[min(self.pending_steps)][2])
+        else:
+            self.finish_loading()
 
     def update_progress(self):
         self.current_step += 1
@@ -155,7 +219,8 @@ class LauncherWindow(QWidget):
             self.status_label.setText("Preparing Application...")
 
         self.progress_bar.setValue(100)
-        QTimer.singleShot(500, self.close)
+        self.loading_finished.emit()
+        self.close()
 
     def return_values(self):
         return self.settings
@@ -0,0 +1,212 @@
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+
+class _ImportTimer:
+    """
+    Finder na początku sys.meta_path: dla obserwowanych modułów pyta o spec pozostałe
+    findery i opakowuje create_module i exec_module loadera, więc mierzony jest
+    skumulowany czas importu (razem z importami zagnieżdżonymi). Dla modułów
+    rozszerzeń (np. PySide6.QtWidgets) większość kosztu to create_module, czyli
+    ładowanie biblioteki współdzielonej.
+    """
+
+    def __init__(self, modules):
+        self.modules = set(modules)
+
+    def _find_elsewhere(self, fullname, path, target):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                return spec
+        return None
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self.modules:
+            return None
+        spec = self._find_elsewhere(fullname, path, target)
+        loader = spec.loader if spec is not None else None
+        # Loadery-klasy (moduły wbudowane, zamrożone) są współdzielone - ich nie ruszamy
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+
+        create_module, exec_module = loader.create_module, loader.exec_module
+        started = None
+
+        def timed_create_module(module_spec):
+            nonlocal started
+            started = time.perf_counter()
+            return create_module(module_spec)
+
+        def timed_exec_module(module):
+            start = started if started is not None else time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                StartupProfiler._record("imports", fullname, start, time.perf_counter())
+
+        loader.create_module = timed_create_module
+        loader.exec_module = timed_exec_module
+        return spec
+
+
+class StartupProfiler:
+    """
+    Opcjonalny profil startu aplikacji: fazy (okno startowe, sprawdzenia,
+    load_config, _init_ui, ...), zdarzenia (pokazanie okna, pierwsze notowania)
+    i czas importu ciężkich modułów, względem chwili importu tego modułu.
+
+    Włączany zmienną HOSSANNA_PROFILE_STARTUP=1 albo flagą --profile-startup.
+    Raport (JSON + podsumowanie tekstowe) trafia do APPDATA/HOSSAnna/logs
+    po pierwszych danych rynkowych i jeszcze raz przy zamknięciu aplikacji.
+    Wyłączony kosztuje jedno sprawdzenie flagi na wywołanie.
+    """
+
+    ENV_VAR = "HOSSANNA_PROFILE_STARTUP"
+    FLAG = "--profile-startup"
+
+    WATCHED_IMPORTS = (
+        "resources_rc",
+        "PySide6",
+        "PySide6.QtWidgets",
+        "numpy",
+        "pandas",
+        "yfinance",
+        "matplotlib",
+        "mplfinance",
+        "sklearn",
+        "tensorflow",
+        "App.AppCreator",
+        "App.Pages.HomePage",
+        "App.Pages.Prediction",
+    )
+
+    _enabled = False
+    _origin = time.perf_counter()
+    _started_at = datetime.now()
+    _events = {"phases": [], "imports": [], "marks": []}
+    _once = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enable_if_requested(argv=None):
+        argv = sys.argv if argv is None else argv
+        requested = os.getenv(StartupProfiler.ENV_VAR, "") not in ("", "0") or StartupProfiler.FLAG in argv
+        # Procesy TrainingPool (spawn) też importują Main - profilowany jest tylko proces GUI
+        if not requested or multiprocessing.parent_process() is not None:
+            return False
+        StartupProfiler._enabled = True
+        sys.meta_path.insert(0, _ImportTimer(StartupProfiler.WATCHED_IMPORTS))
+        return True
+
+    @staticmethod
+    def is_enabled():
+        return StartupProfiler._enabled
+
+    @staticmethod
+    def _record(kind, name, start, end=None):
+        entry = {
+            "name": name,
+            "start": round(start - StartupProfiler._origin, 4),
+            "thread": threading.current_thread().name,
+        }
+        if end is not None:
+            entry["duration"] = round(end - start, 4)
+        with StartupProfiler._lock:
+            StartupProfiler._events[kind].append(entry)
+
+    @staticmethod
+    def mark(name, once=False):
+        """Zdarzenie w chwili wywołania; z once=True tylko pierwsze. Zwraca True, jeśli zapisane."""
+        if not StartupProfiler._enabled:
+            return False
+        if once:
+            with StartupProfiler._lock:
+                if name in StartupProfiler._once:
+                    return False
+                StartupProfiler._once.add(name)
+        StartupProfiler._record("marks", name, time.perf_counter())
+        return True
+
+    @staticmethod
+    def phase(name):
+        """Kontekst mierzący czas trwania fazy."""
+        if not StartupProfiler._enabled:
+            return nullcontext()
+        return StartupProfiler._timed_phase(name)
+
+    @staticmethod
+    @contextmanager
+    def _timed_phase(name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            StartupProfiler._record("phases", name, started, time.perf_counter())
+
+    # --- Raport ---
+
+    @staticmethod
+    def _summary(report):
+        lines = [
+            f"HOSSAnna startup profile - {report['started_at']} ({report['reason']})",
+            f"total {report['total']:.3f}s",
+            "",
+            f"{'start [s]':>10} {'time [s]':>9}  {'kind':<7} event",
+        ]
+        timeline = [
+            (entry["start"], entry.get("duration"), kind.rstrip("s"), entry)
+            for kind in ("phases", "imports", "marks")
+            for entry in report[kind]
+        ]
+        for start, duration, kind, entry in sorted(timeline, key=lambda item: item[0]):
+            duration_text = f"{duration:>9.3f}" if duration is not None else " " * 9
+            thread = "" if entry["thread"] == "MainThread" else f"  [{entry['thread']}]"
+            lines.append(f"{start:>10.3f} {duration_text}  {kind:<7} {entry['name']}{thread}")
+
+        slowest = sorted(report["imports"], key=lambda entry: entry["duration"], reverse=True)[:5]
+        if slowest:
+            lines += ["", "slowest imports:"]
+            lines += [f"  {entry['duration']:>7.3f}s  {entry['name']}" for entry in slowest]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def write_report(reason):
+        """Zapisuje (nadpisuje) raport tego uruchomienia; zwraca ścieżkę JSON albo None."""
+        if not StartupProfiler._enabled:
+            return None
+
+        from Launcher.ConfigManager import ConfigManager
+
+        with StartupProfiler._lock:
+            report = {
+                "started_at": StartupProfiler._started_at.isoformat(timespec="seconds"),
+                "reason": reason,
+                "total": round(time.perf_counter() - StartupProfiler._origin, 4),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "argv": sys.argv,
+                **{kind: list(entries) for kind, entries in StartupProfiler._events.items()},
+            }
+
+        logs_path = ConfigManager.APP_FOLDER_PATH / "logs"
+        stem = f"startup-{StartupProfiler._started_at:%Y%m%d-%H%M%S}"
+        try:
+            logs_path.mkdir(parents=True, exist_ok=True)
+            json_path = logs_path / f"{stem}.json"
+            json_path.write_text(json.dumps(report, indent=1), encoding="utf-8")
+            (logs_path / f"{stem}.txt").write_text(StartupProfiler._summary(report), encoding="utf-8")
+            return json_path
+        except Exception as e:
+            print(f"[StartupProfiler] Error writing report: {e}")
+            return None
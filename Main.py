@@ -1,11 +1,18 @@
 import sys
+# Pierwszy import - od tej chwili liczony jest profil startu (HOSSANNA_PROFILE_STARTUP / --profile-startup)
+from Launcher.StartupProfiler import StartupProfiler
+StartupProfiler.enable_if_requested()
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QObject, Qt
 
+import resources_rc  # ikony launchera i kreatora (App.AppCreator ładuje się później)
 import AppConfigurator
 from Launcher.Launcher import LauncherWindow
 from Launcher.SetupWizard import SetupWizard
-from App.AppCreator import MainWindow
+from App.Data.FetchEngine import get_fetch_engine, shutdown_fetch_engine
+from App.Models.TrainingPool import get_training_pool
+import multiprocessing
 import os
 from PySide6.QtGui import QDesktopServices, QIcon, QPixmap
 import sys
@@ -24,35 +31,102 @@ if getattr(sys, "frozen", False):
     if sys.stderr is None:
         sys.stderr = DummyStream()
 
+# TensorFlow ładuje się tylko w procesach TrainingPool, które dziedziczą środowisko
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-import tensorflow as tf
-tf.get_logger().setLevel("ERROR")
-
-
-
-
-
-
 
 
+def _warm_home_data():
+    # W wątku FetchEngine - import strony głównej nie opóźnia okna startowego
+    try:
+        from App.Pages.HomePage import warm_home_data
+        warm_home_data()
+    except Exception as e:
+        print(f"[Startup] Home data warm-up failed: {e}")
+
+
+class StartupSequence(QObject):
+    """
+    Start aplikacji w jednej pętli zdarzeń:  SPLASH -> [WIZARD] -> MAIN.
+
+    Od pokazania okna startowego notowania i nazwy dla strony głównej pobierane są
+    w tle przez FetchEngine, równolegle ze sprawdzeniami launchera i kreatorem - panele
+    zastają gotowe dane albo podpinają się pod trwające zapytanie. MainWindow budowane
+    jest po zakończeniu sprawdzeń: okno startowe stoi wtedy na 100% z napisem
+    "Preparing Application..." zamiast zamrożonego w połowie paska. Po kreatorze okno
+    powstaje z wybranym w nim językiem i motywem.
+    """
+
+    SPLASH = "splash"
+    WIZARD = "wizard"
+    MAIN = "main"
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        self.state = None
+        self.launcher = None
+        self.wizard = None
+        self.main_window = None
+
+    def start(self):
+        # Okna startowe zamykają się przed pokazaniem głównego - pętla ma działać dalej
+        self.app.setQuitOnLastWindowClosed(False)
+        self.state = self.SPLASH
+        with StartupProfiler.phase("LauncherWindow"):
+            self.launcher = LauncherWindow()
+            self.launcher.loading_finished.connect(self._on_splash_finished)
+            self.launcher.show()
+        get_fetch_engine().run(_warm_home_data)
+
+    def _build_main_window(self):
+        if self.main_window is None:
+            # Import dopiero tutaj - okno startowe pokazuje się przed ładowaniem stron
+            with StartupProfiler.phase("MainWindow"):
+                from App.AppCreator import MainWindow
+                self.main_window = MainWindow()
+
+    def _on_splash_finished(self):
+        StartupProfiler.mark("splash finished")
+        launcher, self.launcher = self.launcher, None
+        if AppConfigurator.InitialSettings.isConfig:
+            # Sygnał przychodzi przed zamknięciem okna startowego: repaint rysuje od razu
+            # końcowy stan (100%), który zostaje na ekranie na czas budowania MainWindow
+            launcher.repaint()
+            self._show_main_window()
+            return
+
+        self.state = self.WIZARD
+        self.wizard = SetupWizard()
+        # Zakończenie i zamknięcie kreatora krzyżykiem prowadzą dalej tak samo
+        self.wizard.setAttribute(Qt.WA_DeleteOnClose)
+        self.wizard.destroyed.connect(self._show_main_window)
+        self.wizard.show()
+        StartupProfiler.mark("setup wizard shown")
+
+    def _show_main_window(self):
+        if self.state == self.MAIN:
+            return
+        self.state = self.MAIN
+        self.wizard = None
+        self._build_main_window()
+        self.main_window.show()
+        StartupProfiler.mark("main window shown")
+        self.app.setQuitOnLastWindowClosed(True)
 
 
 if __name__ == "__main__":
+    # Procesy TrainingPool (spawn) w wersji spakowanej startują z tego samego pliku exe
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon("Launcher/Icons/Logo.ico"))
 
-    launcher = LauncherWindow()
-    launcher.show()
+    startup = StartupSequence(app)
+    startup.start()
     app.exec()
 
-    if not AppConfigurator.InitialSettings.isConfig:
-        setupWizard = SetupWizard()
-        setupWizard.show()
-        app.exec()
-
-    Aplication = MainWindow()
-    Aplication.show()
-    app.exec()
+    StartupProfiler.write_report("exit")
+    get_training_pool().shutdown()
+    shutdown_fetch_engine()
 
 
     sys.exit(0)